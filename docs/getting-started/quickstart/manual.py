@@ -1,7 +1,5 @@
 """Manual quickstart."""
 
-import functools
-
 import fromconfig
 
 import model
@@ -11,7 +9,7 @@ if __name__ == "__main__":
     # Load configs from yaml and merge into one dictionary
     paths = ["config.yaml", "params.yaml"]
     configs = [fromconfig.load(path) for path in paths]
-    config = functools.reduce(fromconfig.utils.merge_dict, configs)
+    config = fromconfig.utils.merge_many(*configs)
 
     # Parse the config (resolve interpolation)
     parser = fromconfig.parser.DefaultParser()
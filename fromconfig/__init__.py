@@ -1,6 +1,6 @@
 # pylint: disable=unused-import,missing-docstring
 
-from fromconfig.core import *
+from fromconfig.core import *  # pylint: disable=redefined-builtin
 from fromconfig import launcher
 from fromconfig import parser
 from fromconfig import utils
@@ -3,7 +3,9 @@
 import functools
 import sys
 import logging
-from typing import Iterable, Mapping
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Mapping, Optional
 
 import fire
 
@@ -12,10 +14,18 @@ import fromconfig
 
 LOGGER = logging.getLogger(__name__)
 
+_MAX_WORKERS_ENV = "FROMCONFIG_MAX_WORKERS"
 
-def launch(paths: Iterable[str], overrides: Mapping, command: str):
+_PREFETCH_ENV = "FROMCONFIG_PREFETCH"
+
+
+def launch(
+    paths: Iterable[str], overrides: Mapping, command: str, max_workers: Optional[int] = None, prefetch: bool = False
+):
     """Load configs, merge, get launcher from plugins and launch.
 
+    Config files are loaded concurrently in a thread pool.
+
     Parameters
     ----------
     paths : Iterable[str]
@@ -24,13 +34,33 @@ def launch(paths: Iterable[str], overrides: Mapping, command: str):
         Optional key value parameters that overrides config files
     command : str
         Rest of the python Fire command
+    max_workers : int, optional
+        Maximum number of threads used to load config files.
+    prefetch : bool, optional
+        If True, import the modules of each config file in the
+        background as soon as it is loaded (see prefetch_imports).
     """
-    configs = [fromconfig.load(path) for path in paths] + [fromconfig.utils.expand(overrides.items())]
-    config = functools.reduce(fromconfig.utils.merge_dict, configs)
+    load = functools.partial(_load, prefetch=prefetch)
+    paths = list(paths)
+    if len(paths) > 1 and max_workers != 1:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fromconfig-load") as executor:
+            configs = list(executor.map(load, paths))
+    else:
+        configs = [load(path) for path in paths]
+    configs.append(fromconfig.utils.expand(overrides.items()))
+    config = fromconfig.utils.merge_many(*configs)
     launcher = fromconfig.launcher.DefaultLauncher.fromconfig(config.pop("launcher", {}))
     launcher(config=config, command=command)
 
 
+def _load(path: str, prefetch: bool):
+    """Load config and optionally import its modules in the background."""
+    config = fromconfig.load(path)
+    if prefetch:
+        fromconfig.prefetch_imports(config)
+    return config
+
+
 def parse_args():
     """Parse arguments from command line using Fire."""
     _paths, _overrides = [], {}  # pylint: disable=invalid-name
@@ -62,4 +92,20 @@ def main():
     sys.path.append(".")  # For local imports
     paths, overrides, command = parse_args()
     if paths or overrides:
-        launch(paths, overrides, command)
+        prefetch = os.environ.get(_PREFETCH_ENV, "").lower() in ("1", "true", "yes")
+        launch(paths, overrides, command, max_workers=_max_workers(), prefetch=prefetch)
+
+
+def _max_workers() -> Optional[int]:
+    """Maximum number of threads from the environment, None for the default."""
+    value = os.environ.get(_MAX_WORKERS_ENV)
+    if not value:
+        return None
+    try:
+        max_workers = int(value)
+    except ValueError:
+        max_workers = 0
+    if max_workers < 1:
+        LOGGER.warning(f"Invalid {_MAX_WORKERS_ENV}={value!r} (expected a positive integer), using default")
+        return None
+    return max_workers
@@ -1,4 +1,8 @@
 # pylint: disable=unused-import,missing-docstring
 
-from fromconfig.core.base import Keys, FromConfig, fromconfig
-from fromconfig.core.config import Config, load, dump
+from fromconfig.core.base import Keys, FromConfig, fromconfig, afromconfig
+from fromconfig.core.config import Config, IncludeCycleError, load, dump
+from fromconfig.core.plan import Plan, compile  # pylint: disable=redefined-builtin
+from fromconfig.core.lazy import LazyConfig, lazy_fromconfig
+from fromconfig.core.instantiator import Instantiator
+from fromconfig.core.prefetch import prefetch_imports
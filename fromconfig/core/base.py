@@ -1,15 +1,21 @@
 """Base functionality."""
 
 from abc import ABC
-from typing import Any
+from concurrent.futures import Executor, wait
+import asyncio
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
 import inspect
 import logging
+import threading
 
 from fromconfig.utils import StrEnum, is_pure_iterable, is_mapping, from_import_string
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Attributes resolved by the caller thread of an executor
+_LOCAL = threading.local()
+
 
 class Keys(StrEnum):
     """Special Keys used by fromconfig.
@@ -65,7 +71,7 @@ class FromConfig(ABC):
         return cls(*args, **kwargs)  # type: ignore
 
 
-def fromconfig(config: Any):
+def fromconfig(config: Any, executor: Optional[Executor] = None, memo: Optional[Dict[int, Tuple[Any, Any]]] = None):
     """From config implementation.
 
     Example
@@ -94,29 +100,255 @@ def fromconfig(config: Any):
     >>> isinstance(point, Point) and point.x == 0 and point.y == 0
     True
 
+    With an executor, sibling subtrees (arguments of the same call or
+    items of the same container) are instantiated concurrently, at the
+    first level with more than one subtree. Each subtree is then built
+    sequentially in the executor. If more than one subtree fails, the
+    error of the first one (in arguments order) is raised.
+
+    >>> import fromconfig
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> config = {"x": {"_attr_": "str", "_args_": [1]}, "y": {"_attr_": "int", "_args_": ["2"]}}
+    >>> with ThreadPoolExecutor(max_workers=2) as executor:
+    ...     fromconfig.fromconfig(config, executor=executor)
+    {'x': '1', 'y': 2}
+
+    The '_attr_' of the subtrees are resolved by the calling thread
+    before submitting them, so that names defined in the scope of the
+    caller can be used with an executor.
+
+    With a memo, a dictionary or list that appears more than once in
+    the config (same object) is only instantiated once and all its
+    occurrences share the same instance. This is the case for configs
+    built programmatically, and for YAML anchors in files loaded with
+    `load`. Parsers (in particular the OmegaConfParser used by the
+    launchers) rebuild the config, so shared nodes are not preserved
+    by the command line (use `_singleton_` instead).
+
+    >>> import fromconfig
+    >>> shared = {"_attr_": "list"}
+    >>> instance = fromconfig.fromconfig({"x": shared, "y": shared}, memo={})
+    >>> instance["x"] is instance["y"]
+    True
+
     Parameters
     ----------
     config : Any
         Typically a dictionary
+    executor : Executor, optional
+        If given, used to instantiate independent subtrees concurrently.
+    memo : Dict[int, Tuple[Any, Any]], optional
+        If given, instances of dictionaries and lists by object id. With
+        an executor, a shared node built concurrently by two threads may
+        be instantiated twice.
     """
+    if memo is not None and (is_mapping(config) or is_pure_iterable(config)):
+        entry = memo.get(id(config))
+        if entry is not None and entry[0] is config:
+            return entry[1]
+        instance = _fromconfig(config, executor, memo)
+        memo[id(config)] = (config, instance)
+        return instance
+    return _fromconfig(config, executor, memo)
+
+
+def _fromconfig(config: Any, executor: Optional[Executor], memo: Optional[Dict[int, Tuple[Any, Any]]]):
+    """Implementation of fromconfig (without memoization)."""
     if is_mapping(config):
-        # Resolve attribute, check if subclass of FromConfig
-        attr = from_import_string(config[Keys.ATTR]) if Keys.ATTR in config else None
-        if inspect.isclass(attr) and issubclass(attr, FromConfig):
-            return attr.fromconfig({key: value for key, value in config.items() if key != Keys.ATTR})
+        node = _resolve_node(config)
+        if node.config is not None:
+            return node.attr.fromconfig(node.config)
 
         # Resolve and instantiate args and kwargs
-        args = fromconfig(config.get(Keys.ARGS, []))
-        kwargs = {key: fromconfig(value) for key, value in config.items() if key not in Keys}
+        if executor is not None and is_pure_iterable(node.args):
+            keys = list(node.kwargs)
+            values = _fromconfig_all(list(node.args) + list(node.kwargs.values()), executor, memo)
+            args = type(node.args)(values[: len(node.args)])
+            kwargs = dict(zip(keys, values[len(node.args) :]))
+        else:
+            args = fromconfig(node.args, executor, memo)
+            kwargs = {key: fromconfig(value, executor, memo) for key, value in node.kwargs.items()}
+
+        # No attribute resolved, return args and kwargs
+        if node.attr is None:
+            return type(config)({Keys.ARGS: args, **kwargs}) if args else type(config)(kwargs)
+
+        # If attribute resolved, call attribute with args and kwargs
+        return node.attr(*args, **kwargs)
+
+    if is_pure_iterable(config):
+        if executor is not None:
+            return type(config)(_fromconfig_all(list(config), executor, memo))
+        return type(config)(fromconfig(item, memo=memo) for item in config)
+
+    return config
+
+
+class _Node(NamedTuple):
+    """Mapping config with its '_attr_' resolved and its keys split.
+
+    Attributes
+    ----------
+    attr : Any
+        Resolved '_attr_', None if missing.
+    config : Dict, optional
+        If attr is a FromConfig subclass, config for its fromconfig
+        (all keys but '_attr_'), otherwise None.
+    args : Any
+        Config of the positional arguments ('_args_', [] if missing).
+    kwargs : Dict
+        Configs of the keyword arguments (all non-special keys).
+    """
+
+    attr: Any
+    config: Optional[Dict]
+    args: Any
+    kwargs: Dict
+
+
+def _resolve_node(config: Mapping) -> _Node:
+    """Resolve the '_attr_' of a mapping config and split its keys."""
+    attr = _from_import_string(config[Keys.ATTR]) if Keys.ATTR in config else None
+    if inspect.isclass(attr) and issubclass(attr, FromConfig):
+        return _Node(attr, {key: value for key, value in config.items() if key != Keys.ATTR}, [], {})
+    kwargs = {key: value for key, value in config.items() if key not in Keys}
+    return _Node(attr, None, config.get(Keys.ARGS, []), kwargs)
+
+
+def _fromconfig_all(items: List[Any], executor: Executor, memo: Optional[Dict[int, Tuple[Any, Any]]]) -> List[Any]:
+    """Instantiate items, concurrently if more than one is nested.
+
+    Parameters
+    ----------
+    items : List[Any]
+        Configs to instantiate.
+    executor : Executor
+        Used to instantiate nested items concurrently.
+    memo : Dict[int, Tuple[Any, Any]], optional
+        Instances of dictionaries and lists by object id.
+    """
+    nested = [idx for idx, item in enumerate(items) if is_mapping(item) or is_pure_iterable(item)]
+    if len(nested) <= 1:
+        return [fromconfig(item, executor, memo) for item in items]
+
+    # Wait for all futures so that errors are reported in order
+    attrs = _resolve_attrs([items[idx] for idx in nested])
+    futures = {idx: executor.submit(_fromconfig_with_attrs, items[idx], memo, attrs) for idx in nested}
+    wait(list(futures.values()))
+    return [futures[idx].result() if idx in futures else item for idx, item in enumerate(items)]
+
+
+def _from_import_string(name: str) -> Any:
+    """Same as from_import_string, using names resolved by the caller of the executor."""
+    attrs = getattr(_LOCAL, "attrs", None)
+    if attrs is not None and isinstance(name, str) and name in attrs:
+        return attrs[name]
+    return from_import_string(name)
+
+
+def _resolve_attrs(items: List[Any]) -> Dict[str, Any]:
+    """Resolve the '_attr_' of items in the current thread.
+
+    Names that cannot be resolved are skipped, the error is raised
+    when the item is instantiated. The subtrees of FromConfig nodes are
+    not visited, their config is interpreted by their fromconfig.
+    """
+    attrs = {}  # type: Dict[str, Any]
+    stack = list(items)
+    while stack:
+        item = stack.pop()
+        if is_mapping(item):
+            name = item.get(Keys.ATTR)
+            if isinstance(name, str) and name not in attrs:
+                try:
+                    attrs[name] = _from_import_string(name)
+                except (ImportError, ValueError):
+                    pass
+            attr = attrs.get(name) if isinstance(name, str) else name
+            if inspect.isclass(attr) and issubclass(attr, FromConfig):
+                continue
+            stack.extend(item.values())
+        elif is_pure_iterable(item):
+            stack.extend(item)
+    return attrs
+
+
+def _fromconfig_with_attrs(config: Any, memo: Optional[Dict[int, Tuple[Any, Any]]], attrs: Dict[str, Any]):
+    """Instantiate config in an executor, with attributes resolved by the caller."""
+    previous = getattr(_LOCAL, "attrs", None)
+    _LOCAL.attrs = attrs
+    try:
+        return fromconfig(config, None, memo)
+    finally:
+        _LOCAL.attrs = previous
+
+
+async def afromconfig(config: Any):
+    """Asynchronous from config implementation.
+
+    Same as fromconfig, but results of the calls that are awaitable
+    (typically coroutines from `async def` factories) are awaited, and
+    sibling subtrees are instantiated concurrently with asyncio.gather.
+
+    FromConfig subclasses that define an `afromconfig` classmethod are
+    instantiated with it (it is awaited if it returns an awaitable),
+    otherwise with their `fromconfig` classmethod.
+
+    Example
+    -------
+    >>> import asyncio
+    >>> import fromconfig
+    >>> async def add(x, y):
+    ...     return x + y
+    >>> config = {"_attr_": "add", "x": 1, "y": {"_attr_": "add", "x": 2, "y": 3}}
+    >>> asyncio.get_event_loop().run_until_complete(fromconfig.afromconfig(config))
+    6
+
+    Parameters
+    ----------
+    config : Any
+        Typically a dictionary
+    """
+    if is_mapping(config):
+        node = _resolve_node(config)
+        if node.config is not None:
+            if hasattr(node.attr, "afromconfig"):
+                result = node.attr.afromconfig(node.config)
+                return (await result) if inspect.isawaitable(result) else result
+            return node.attr.fromconfig(node.config)
+
+        # Resolve and instantiate args and kwargs concurrently
+        keys = list(node.kwargs)
+        if is_pure_iterable(node.args):
+            values = await _afromconfig_all(list(node.args) + list(node.kwargs.values()))
+            args = type(node.args)(values[: len(node.args)])
+            kwargs = dict(zip(keys, values[len(node.args) :]))
+        else:
+            args = await afromconfig(node.args)
+            kwargs = dict(zip(keys, await _afromconfig_all(list(node.kwargs.values()))))
 
         # No attribute resolved, return args and kwargs
-        if attr is None:
+        if node.attr is None:
             return type(config)({Keys.ARGS: args, **kwargs}) if args else type(config)(kwargs)
 
         # If attribute resolved, call attribute with args and kwargs
-        return attr(*args, **kwargs)
+        result = node.attr(*args, **kwargs)
+        return (await result) if inspect.isawaitable(result) else result
 
     if is_pure_iterable(config):
-        return type(config)(fromconfig(item) for item in config)
+        return type(config)(await _afromconfig_all(list(config)))
 
     return config
+
+
+async def _afromconfig_all(items: List[Any]) -> List[Any]:
+    """Instantiate nested items concurrently.
+
+    Parameters
+    ----------
+    items : List[Any]
+        Configs to instantiate.
+    """
+    nested = [idx for idx, item in enumerate(items) if is_mapping(item) or is_pure_iterable(item)]
+    results = dict(zip(nested, await asyncio.gather(*(afromconfig(items[idx]) for idx in nested))))
+    return [results[idx] if idx in results else item for idx, item in enumerate(items)]
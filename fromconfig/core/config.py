@@ -1,18 +1,23 @@
 """Config serialization utilities."""
 
 from pathlib import Path
-from typing import Union, Any, IO, Dict
+from typing import Union, Any, IO, Dict, List, Optional, Tuple
+import copy
+import functools
+import hashlib
 import json
 import logging
 import os
 from operator import itemgetter
+import pickle
 import re
-import io
+import threading
 
 import yaml
 
 from fromconfig.core import base
 from fromconfig.utils import try_import, merge_dict, is_pure_iterable, is_mapping
+from fromconfig.version import __version__
 
 
 _jsonnet = try_import("_jsonnet")
@@ -45,36 +50,114 @@ class Config(base.FromConfig, dict):
         return cls(config)
 
 
+_CACHE_DIR_ENV = "FROMCONFIG_CACHE_DIR"
+
 _YAML_MERGE = "<<:"
 
 _YAML_INCLUDE = "!include"
 
+_YAML_MERGE_INCLUDE = re.compile(f"{_YAML_MERGE} *{_YAML_INCLUDE}")
 
-class IncludeLoader(yaml.SafeLoader):
-    """YAML Loader with `!include` constructor to load files."""
 
-    def __init__(self, stream: IO) -> None:
+class _IncludeExpander:
+    """Read-only stream rewriting the `<<: !include` lines of a stream.
+
+    Lines are read from the underlying stream and rewritten on demand,
+    by chunks of the size requested by the YAML reader.
+    """
+
+    def __init__(self, stream: IO):
+        if hasattr(stream, "name"):
+            self.name = stream.name  # Forward name for Loader
+        self._lines = enumerate(stream)
+        self._buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        """Read at most size characters (all if negative)."""
+        chunks, length = [self._buffer], len(self._buffer)
+        while size < 0 or length < size:
+            try:
+                idx, line = next(self._lines)
+            except StopIteration:
+                break
+            if line.startswith(_YAML_MERGE) and _YAML_MERGE_INCLUDE.match(line):
+                line = f"{idx}{_YAML_INCLUDE}{line}"
+            chunks.append(line)
+            length += len(line)
+        content = "".join(chunks)
+        if size < 0:
+            self._buffer = ""
+            return content
+        self._buffer = content[size:]
+        return content[:size]
+
+
+class IncludeCycleError(ValueError):
+    """Raised when a file includes itself, directly or not."""
+
+
+class _LoadContext:
+    """State shared by the nested loads of a top-level load.
+
+    Attributes
+    ----------
+    dependencies : List[Tuple[str, int, int]]
+        Path, modification time (ns) and size of the loaded files.
+    cacheable : bool
+        False if the result should not be persisted.
+    stack : List[str]
+        Absolute paths of the files being loaded (include chain).
+    loaded : Dict[str, Any]
+        Loaded files by absolute path.
+    """
+
+    def __init__(self):
+        self.dependencies = []  # type: List[Tuple[str, int, int]]
+        self.cacheable = True
+        self.stack = []  # type: List[str]
+        self.loaded = {}  # type: Dict[str, Any]
+
+
+class _IncludeMixin:
+    """Set root directory of `!include` paths from the stream name."""
+
+    def __init__(self, stream: IO, context: Optional[_LoadContext] = None) -> None:
         """Initialize Loader."""
         try:
             self.root = os.path.split(stream.name)[0]
         except AttributeError:
             self.root = os.path.curdir
-        super().__init__(stream)
+        self.context = context
+        super().__init__(stream)  # type: ignore
+
+
+class IncludeLoader(_IncludeMixin, yaml.SafeLoader):
+    """YAML Loader with `!include` constructor to load files."""
+
+
+if hasattr(yaml, "CSafeLoader"):
+
+    class CIncludeLoader(_IncludeMixin, yaml.CSafeLoader):  # type: ignore
+        """Same as IncludeLoader, using the libyaml parser."""
+
+else:
+    CIncludeLoader = IncludeLoader  # type: ignore
 
 
 def include(loader, node: yaml.Node) -> Any:
     """Include file referenced at node."""
     path = os.path.join(loader.root, loader.construct_scalar(node))
-    return load(path)
+    return _load(path, getattr(loader, "context", None) or _LoadContext())
 
 
 IncludeLoader.add_constructor(_YAML_INCLUDE, include)
+CIncludeLoader.add_constructor(_YAML_INCLUDE, include)
 
 
 def yaml_load(stream, Loader):  # pylint: disable=invalid-name
     """Custom yaml load to handle !include and merges."""
 
-    def _expand_includes(s: IO) -> IO:
+    def _expand_includes(s: IO) -> _IncludeExpander:
         """Expand includes before merging.
 
         The IncludeLoader does not work with the YAML merge key.
@@ -89,16 +172,10 @@ def yaml_load(stream, Loader):  # pylint: disable=invalid-name
 
         Returns
         -------
-        str
+        _IncludeExpander
+            A stream of the expanded lines, read lazily from s.
         """
-        content = ""
-        for idx, line in enumerate(s.readlines()):
-            if re.match(f"{_YAML_MERGE} *{_YAML_INCLUDE} *.*", line):
-                line = re.sub(f"{_YAML_MERGE} ", line, f"{idx}{_YAML_INCLUDE}{_YAML_MERGE} ")
-            content += line
-        result = io.StringIO(content)
-        setattr(result, "name", stream.name)  # Forward name for Loader
-        return result
+        return _IncludeExpander(s)
 
     def _merge_includes(item: Any) -> Any:
         """Merge includes.
@@ -115,6 +192,9 @@ def yaml_load(stream, Loader):  # pylint: disable=invalid-name
         -------
         Any
         """
+        # Nodes shared in the YAML stream (anchors) stay shared
+        if id(item) in merged:
+            return merged[id(item)]
         if is_mapping(item):
             result = {}  # type: Dict[Any, Any]
             for key, value in sorted(item.items(), key=itemgetter(0)):
@@ -127,31 +207,108 @@ def yaml_load(stream, Loader):  # pylint: disable=invalid-name
                         result = merge_dict(result, {subkey: _merge_includes(subvalue)}, allow_override=False)
                 else:
                     result[key] = _merge_includes(value)
+            merged[id(item)] = result
             return result
         if is_pure_iterable(item):
-            return [_merge_includes(it) for it in item]
+            merged[id(item)] = [_merge_includes(it) for it in item]
+            return merged[id(item)]
         return item
 
+    merged = {}  # type: Dict[int, Any]
     return _merge_includes(yaml.load(_expand_includes(stream), Loader))
 
 
-def load(path: Union[str, Path]):
+def load(path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None):
     """Load dictionary from path.
 
+    If a cache directory is given (or set with the FROMCONFIG_CACHE_DIR
+    environment variable), YAML and JSON files are cached in binary
+    form (pickle). The cache entry of a file is invalidated when the
+    modification time or size of the file or of one of its includes
+    changes.
+
     Parameters
     ----------
     path : Union[str, Path]
         Path to file (yaml, yml, json or jsonnet format)
+    cache_dir : Union[str, Path], optional
+        Directory of the persistent cache.
+    """
+    cache_dir = cache_dir or os.environ.get(_CACHE_DIR_ENV)
+    if not cache_dir or Path(path).suffix not in (".yaml", ".yml", ".json"):
+        return _load(path, _LoadContext())
+
+    # Look for a valid cache entry
+    cache_path = _cache_path(path, cache_dir)
+    try:
+        with cache_path.open("rb") as file:
+            dependencies, config = pickle.load(file)
+        if all(_stat(dep_path) == (dep_path, mtime, size) for dep_path, mtime, size in dependencies):
+            return config
+    except FileNotFoundError:
+        pass
+    except Exception as e:  # pylint: disable=broad-except
+        LOGGER.warning(f"Unable to read cache entry {cache_path} for {path} ({e})")
+
+    # Load and write the cache entry (atomic replace)
+    context = _LoadContext()
+    config = _load(path, context)
+    if context.cacheable:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with tmp_path.open("wb") as file:
+                pickle.dump((context.dependencies, config), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:  # pylint: disable=broad-except
+            LOGGER.warning(f"Unable to write cache entry {cache_path} for {path} ({e})")
+    return config
+
+
+def _load(path: Union[str, Path], context: _LoadContext):
+    """Load dictionary from path, once per context.
+
+    Files already loaded in the same context (for example included
+    multiple times) are not parsed again, a copy of the first result
+    is returned instead.
+
+    Raises
+    ------
+    IncludeCycleError
+        If path is already being loaded (include cycle).
     """
+    key = os.path.abspath(path)
+    if key in context.stack:
+        chain = context.stack[context.stack.index(key) :] + [key]
+        raise IncludeCycleError(f"Include cycle detected: {' -> '.join(chain)}")
+    if key in context.loaded:
+        return copy.deepcopy(context.loaded[key])
+    context.stack.append(key)
+    try:
+        config = _load_file(path, context)
+    finally:
+        context.stack.pop()
+    context.loaded[key] = config
+    return config
+
+
+def _load_file(path: Union[str, Path], context: _LoadContext):
+    """Load dictionary from path, recording dependencies in context."""
     suffix = Path(path).suffix
     if suffix in (".yaml", ".yml"):
+        context.dependencies.append(_stat(path))
         with Path(path).open() as file:
             try:
-                return yaml_load(file, IncludeLoader)
+                return yaml_load(file, functools.partial(CIncludeLoader, context=context))
+            except IncludeCycleError:
+                raise
             except Exception as e:  # pylint: disable=broad-except
                 LOGGER.error(f"Unable to use custom yaml_load ({e}), using yaml.safe_load instead.")
+                context.cacheable = False
+                file.seek(0)
                 return yaml.safe_load(file)
     if suffix == ".json":
+        context.dependencies.append(_stat(path))
         with Path(path).open() as file:
             return json.load(file)
     if suffix == ".jsonnet":
@@ -159,10 +316,27 @@ def load(path: Union[str, Path]):
             msg = f"jsonnet is not installed but the resolved path extension is {suffix}. "
             msg += "Visit https://jsonnet.org for installation instructions."
             raise ImportError(msg)
+        context.cacheable = False  # Imports of jsonnet files are not tracked
         return json.loads(_jsonnet.evaluate_file(str(path)))
     raise ValueError(f"Unable to resolve method for path {path}")
 
 
+def _stat(path: Union[str, Path]) -> Tuple[str, int, int]:
+    """Absolute path, modification time (ns) and size of file."""
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return path, -1, -1
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _cache_path(path: Union[str, Path], cache_dir: Union[str, Path]) -> Path:
+    """Path of the cache entry of path."""
+    key = hashlib.blake2b(f"{__version__}:{os.path.abspath(path)}".encode(), digest_size=16).hexdigest()
+    return Path(cache_dir).expanduser() / f"{key}.pickle"
+
+
 def dump(config, path: Union[str, Path]):
     """Dump dictionary content to file in path.
 
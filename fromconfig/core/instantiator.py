@@ -0,0 +1,122 @@
+"""Incremental instantiation."""
+
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+import hashlib
+
+from fromconfig.core.base import Keys, _resolve_node
+from fromconfig.utils import is_mapping, is_pure_iterable, fingerprint
+
+
+class _Record(NamedTuple):
+    """Instance of a subtree with its typed digest and its children."""
+
+    digest: bytes
+    instance: Any
+    children: Dict[Any, "_Record"]
+
+
+class Instantiator:
+    """Instantiate configs, reusing unchanged subtrees between calls.
+
+    Each call remembers the instance of every subtree of the config,
+    keyed by its path and its fingerprint (see fingerprint). On the
+    next call, subtrees whose content did not change are not rebuilt,
+    the previous instances are reused. Subtrees that changed, and their
+    ancestors, are rebuilt.
+
+    Example
+    -------
+    >>> import fromconfig
+    >>> instantiator = fromconfig.Instantiator()
+    >>> config = {"data": {"_attr_": "list", "_args_": [[1, 2]]}, "dim": 10}
+    >>> first = instantiator(config)
+    >>> second = instantiator({"data": {"_attr_": "list", "_args_": [[1, 2]]}, "dim": 20})
+    >>> second["dim"]
+    20
+    >>> second["data"] is first["data"]
+    True
+    """
+
+    def __init__(self):
+        self._record: Optional[_Record] = None
+
+    def __call__(self, config: Any) -> Any:
+        """Instantiate config, reusing instances of the previous call.
+
+        Parameters
+        ----------
+        config : Any
+            Typically a dictionary
+        """
+        memo: Dict[int, Tuple[Any, bytes]] = {}
+        fingerprint(config, memo)
+        digests: Dict[int, bytes] = {}
+        _digest(config, memo, digests)
+        instance, self._record = self._build(config, self._record, digests)
+        return instance
+
+    def clear(self):
+        """Forget instances of the previous call."""
+        self._record = None
+
+    def _build(self, config: Any, previous: Optional[_Record], digests: Dict) -> Tuple[Any, Optional[_Record]]:
+        """Recursive implementation, returns instance and record."""
+        if not (is_mapping(config) or is_pure_iterable(config)):
+            return config, None
+
+        # Reuse previous instance if the subtree is unchanged
+        digest = digests[id(config)]
+        if previous is not None and previous.digest == digest:
+            return previous.instance, previous
+        children = previous.children if previous is not None else {}
+        records: Dict[Any, _Record] = {}
+
+        def _child(key, value):
+            instance, record = self._build(value, children.get(key), digests)
+            if record is not None:
+                records[key] = record
+            return instance
+
+        if is_mapping(config):
+            node = _resolve_node(config)
+            if node.config is not None:
+                instance = node.attr.fromconfig(node.config)
+                return instance, _Record(digest, instance, records)
+
+            # Resolve and instantiate args and kwargs
+            args = _child(Keys.ARGS.value, node.args) if Keys.ARGS in config else []
+            kwargs = {key: _child(key, value) for key, value in node.kwargs.items()}
+            if node.attr is None:
+                instance = type(config)({Keys.ARGS: args, **kwargs}) if args else type(config)(kwargs)
+            else:
+                instance = node.attr(*args, **kwargs)
+        else:
+            instance = type(config)(_child(idx, item) for idx, item in enumerate(config))
+
+        return instance, _Record(digest, instance, records)
+
+
+def _digest(item: Any, memo: Dict[int, Tuple[Any, bytes]], digests: Dict[int, bytes]) -> bytes:
+    """Digest of item from its fingerprint and the types of its containers.
+
+    The fingerprint does not distinguish lists from tuples, or dicts
+    from dict subclasses, but the instances built from them differ.
+    """
+    if not (is_mapping(item) or is_pure_iterable(item)):
+        return b""
+    if id(item) not in digests:
+        if is_mapping(item):
+            children = sorted(
+                hashlib.blake2b(_digest(value, memo, digests) + repr(key).encode(), digest_size=16).digest()
+                for key, value in item.items()
+            )
+        else:
+            children = [_digest(child, memo, digests) for child in item]
+            if isinstance(item, (set, frozenset)):
+                children.sort()
+        hasher = hashlib.blake2b(memo[id(item)][1], digest_size=16)
+        hasher.update(f"{type(item).__module__}.{type(item).__qualname__}".encode())
+        for child in children:
+            hasher.update(child)
+        digests[id(item)] = hasher.digest()
+    return digests[id(item)]
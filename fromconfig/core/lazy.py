@@ -0,0 +1,118 @@
+"""Lazy instantiation."""
+
+from typing import Any, Mapping
+
+from fromconfig.core.base import Keys, fromconfig
+from fromconfig.utils import is_mapping
+
+
+class LazyConfig(dict):
+    """Dictionary whose values are instantiated on first access.
+
+    Values are instantiated with `fromconfig` the first time they are
+    accessed, then cached. Values that are plain mappings (no `_attr_`
+    key) are themselves wrapped into a LazyConfig, so that only the
+    accessed path of a nested config is instantiated.
+
+    Values are accessed (and instantiated) by key, attribute, `get`,
+    `pop`, `values`, `items`, `copy` and comparisons (`==`, `!=`). Keys
+    can be listed without instantiating values (`keys`, iteration,
+    `in`, `len`). `repr` shows the values that are not instantiated
+    yet as is. Other dict methods (`update`, `setdefault`, `popitem`)
+    operate on the values as stored.
+
+    Example
+    -------
+    >>> import fromconfig
+    >>> config = {
+    ...     "model": {"dim": {"_attr_": "int", "_args_": ["10"]}},
+    ...     "other": {"_attr_": "print", "_args_": ["Not instantiated"]}
+    ... }
+    >>> lazy = fromconfig.LazyConfig(config)
+    >>> lazy["model"]["dim"]
+    10
+    >>> lazy.model.dim
+    10
+    """
+
+    def __init__(self, config: Mapping):
+        super().__init__(config)
+        self._instantiated = set()  # type: ignore
+        # Fire help shows the docstring of the component, which for an
+        # instance is the docstring of its class. Shadow it on the instance
+        # so that the help of the LocalLauncher with lazy=True lists the
+        # entries of the config instead of documenting LazyConfig.
+        self.__doc__ = None
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if key not in self._instantiated:
+            value = lazy_fromconfig(value)
+            super().__setitem__(key, value)
+            self._instantiated.add(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._instantiated.add(key)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError as e:
+            raise AttributeError(name) from e
+
+    def __eq__(self, other):
+        if not is_mapping(other):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __repr__(self):
+        return f"{type(self).__name__}({super().__repr__()})"
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key, *default):
+        if key not in self:
+            return super().pop(key, *default)
+        value = self[key]
+        super().pop(key)
+        self._instantiated.discard(key)
+        return value
+
+    def copy(self):
+        return dict(self.items())
+
+    def values(self):  # type: ignore
+        return [self[key] for key in self]
+
+    def items(self):  # type: ignore
+        return [(key, self[key]) for key in self]
+
+
+def lazy_fromconfig(config: Any) -> Any:
+    """Same as fromconfig, but plain mappings are instantiated lazily.
+
+    Parameters
+    ----------
+    config : Any
+        Typically a dictionary
+
+    Returns
+    -------
+    Any
+        A LazyConfig if config is a mapping without `_attr_` key,
+        otherwise the result of `fromconfig(config)`.
+    """
+    if isinstance(config, LazyConfig):
+        return config
+    if is_mapping(config) and Keys.ATTR not in config:
+        return LazyConfig(config)
+    return fromconfig(config)
@@ -0,0 +1,197 @@
+"""Compiled instantiation plans."""
+
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import copy
+
+from fromconfig.core.base import Keys, _resolve_node
+from fromconfig.utils import is_mapping, is_pure_iterable, from_dotlist, to_dotlist
+from fromconfig.utils.patch import apply_patch
+
+
+# Step operations
+_VALUE = 0  # (_VALUE, value)
+_SEQUENCE = 1  # (_SEQUENCE, type, items)
+_MAPPING = 2  # (_MAPPING, type, args, keys, values)
+_CALL = 3  # (_CALL, attr, args, keys, values)
+_FROMCONFIG = 4  # (_FROMCONFIG, attr, config)
+
+
+class Plan:
+    """Flat list of construction steps compiled from a config.
+
+    Each step creates one node of the config from the results of the
+    previous steps, with attributes already imported. Executing a plan
+    is equivalent to calling `fromconfig` on the compiled config, but
+    skips the inspection of the config (special keys, imports, etc.).
+
+    Leaf values can be substituted at execution time, by dot-list. The
+    substituted values are used as is (they are not instantiated).
+
+    Example
+    -------
+    >>> import fromconfig
+    >>> config = {"_attr_": "dict", "x": {"_attr_": "str", "_args_": [1]}}
+    >>> plan = fromconfig.compile(config)
+    >>> plan()
+    {'x': '1'}
+    >>> plan({"x._args_[0]": 2})
+    {'x': '2'}
+
+    Attributes
+    ----------
+    steps : List[Tuple]
+        Construction steps, the last step creates the root.
+    leaves : Dict[str, int]
+        Step index of each leaf value, by dot-list.
+    configs : Dict[str, int]
+        Step index of each FromConfig subclass node, by dot-list. The
+        sub-config of these nodes is given as is to their fromconfig
+        method, substitutions inside are applied to that sub-config.
+    """
+
+    def __init__(self, steps: List[Tuple], leaves: Dict[str, int], configs: Dict[str, int]):
+        self.steps = steps
+        self.leaves = leaves
+        self.configs = configs
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(steps={len(self)})"
+
+    def __call__(self, substitutions: Optional[Mapping[str, Any]] = None) -> Any:
+        """Execute plan.
+
+        Parameters
+        ----------
+        substitutions : Mapping[str, Any], optional
+            New leaf values, by dot-list.
+
+        Returns
+        -------
+        Any
+            The instantiated config.
+
+        Raises
+        ------
+        KeyError
+            If a substitution does not target a leaf of the plan.
+        """
+        overrides = self._overrides(substitutions) if substitutions else {}
+        values: List[Any] = [None] * len(self.steps)
+        for idx, step in enumerate(self.steps):
+            op = step[0]
+            if idx in overrides:
+                if op == _VALUE:
+                    values[idx] = overrides[idx]
+                    continue
+                step = (op, step[1], overrides[idx])
+            if op == _VALUE:
+                values[idx] = step[1]
+            elif op == _CALL:
+                args = values[step[2]] if step[2] is not None else []
+                values[idx] = step[1](*args, **{key: values[pos] for key, pos in zip(step[3], step[4])})
+            elif op == _SEQUENCE:
+                values[idx] = step[1](values[pos] for pos in step[2])
+            elif op == _MAPPING:
+                args = values[step[2]] if step[2] is not None else []
+                kwargs = {key: values[pos] for key, pos in zip(step[3], step[4])}
+                values[idx] = step[1]({Keys.ARGS: args, **kwargs}) if args else step[1](kwargs)
+            else:
+                # Copy so that instances do not share the sub-config of the plan
+                values[idx] = step[1].fromconfig(copy.deepcopy(step[2]))
+        return values[-1]
+
+    def _overrides(self, substitutions: Mapping[str, Any]) -> Dict[int, Any]:
+        """Resolve substitutions into new values by step index."""
+        overrides: Dict[int, Any] = {}
+        for dotlist, value in substitutions.items():
+            if dotlist in self.leaves:
+                overrides[self.leaves[dotlist]] = value
+                continue
+
+            # Look for a FromConfig node containing the path
+            keys = from_dotlist(dotlist)
+            for end in range(len(keys) - 1, -1, -1):
+                prefix = to_dotlist(keys[:end])
+                if prefix in self.configs:
+                    idx = self.configs[prefix]
+                    config = overrides.get(idx, self.steps[idx][2])
+                    if not _has_path(config, keys[end:]):
+                        raise KeyError(f"Substitution {dotlist} is not a path of the sub-config at {prefix or 'root'}")
+                    overrides[idx] = apply_patch(config, {to_dotlist(keys[end:]): value})
+                    break
+            else:
+                raise KeyError(f"Substitution {dotlist} is not a leaf of the plan (leaves: {list(self.leaves)})")
+        return overrides
+
+
+def _has_path(config: Any, keys: Tuple) -> bool:
+    """Check that keys is the path of an existing node of config."""
+    node = config
+    for key in keys:
+        if is_mapping(node) and key in node:
+            node = node[key]
+        elif is_pure_iterable(node) and isinstance(key, int) and 0 <= key < len(node):
+            node = list(node)[key]
+        else:
+            return False
+    return True
+
+
+def compile(config: Any) -> Plan:  # pylint: disable=redefined-builtin
+    """Compile config into a reusable instantiation plan.
+
+    Imports and FromConfig checks are resolved once, at compile time.
+
+    Example
+    -------
+    >>> import fromconfig
+    >>> plan = fromconfig.compile({"_attr_": "str", "_args_": ["hello"]})
+    >>> plan() == plan({"_args_[0]": "hello"}) == "hello"
+    True
+
+    Parameters
+    ----------
+    config : Any
+        Typically a dictionary
+
+    Returns
+    -------
+    Plan
+    """
+    steps: List[Tuple] = []
+    leaves: Dict[str, int] = {}
+    configs: Dict[str, int] = {}
+
+    def _compile(item: Any, path: Tuple) -> int:
+        """Recursive implementation, returns index of the step."""
+        if is_mapping(item):
+            node = _resolve_node(item)
+            if node.config is not None:
+                steps.append((_FROMCONFIG, node.attr, node.config))
+                configs[to_dotlist(path)] = len(steps) - 1
+                return len(steps) - 1
+
+            # Compile args and kwargs
+            args = _compile(node.args, (*path, Keys.ARGS.value)) if Keys.ARGS in item else None
+            keys = list(node.kwargs)
+            values = [_compile(value, (*path, str(key))) for key, value in node.kwargs.items()]
+            if node.attr is None:
+                steps.append((_MAPPING, type(item), args, keys, values))
+            else:
+                steps.append((_CALL, node.attr, args, keys, values))
+            return len(steps) - 1
+
+        if is_pure_iterable(item):
+            items = [_compile(it, (*path, idx)) for idx, it in enumerate(item)]
+            steps.append((_SEQUENCE, type(item), items))
+            return len(steps) - 1
+
+        steps.append((_VALUE, item))
+        leaves[to_dotlist(path)] = len(steps) - 1
+        return len(steps) - 1
+
+    _compile(config, ())
+    return Plan(steps, leaves, configs)
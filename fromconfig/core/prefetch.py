@@ -0,0 +1,92 @@
+"""Background import of the modules of a config."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterator, List, Optional
+import importlib
+import logging
+
+from fromconfig.core.base import Keys
+from fromconfig.utils import is_mapping, is_pure_iterable
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def prefetch_imports(config: Any, max_workers: Optional[int] = None) -> List[Future]:
+    """Import the modules of the `_attr_` of config in the background.
+
+    The modules are imported in a thread pool, so that the time spent
+    importing heavy modules overlaps with the rest of the startup
+    (loading and parsing configs). Instantiation does not need to wait
+    for the prefetch: an import already in progress in the background
+    simply blocks until it is done.
+
+    Modules are imported outside of the main thread, which is not
+    supported by modules with import-time side effects that require the
+    main thread (for example `signal.signal`).
+
+    Import strings that are not resolved yet (containing `${`) are
+    ignored. Failures are logged and ignored, they are reported again
+    at instantiation time.
+
+    Example
+    -------
+    >>> import fromconfig
+    >>> config = {"model": {"_attr_": "collections.OrderedDict"}}
+    >>> futures = fromconfig.prefetch_imports(config)
+    >>> [future.result() for future in futures]
+    ['collections']
+
+    Parameters
+    ----------
+    config : Any
+        Typically a dictionary
+    max_workers : int, optional
+        Maximum number of threads
+
+    Returns
+    -------
+    List[Future]
+        One future per module, with the name of the imported module
+        (None if the import failed).
+    """
+    candidates = list(dict.fromkeys(name.rsplit(".", 1)[0] for name in _iter_import_strings(config) if "." in name))
+    if not candidates:
+        return []
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fromconfig-prefetch")
+    futures = [executor.submit(_import, name) for name in candidates]
+    executor.shutdown(wait=False)
+    return futures
+
+
+def _iter_import_strings(config: Any) -> Iterator[str]:
+    """Iterate over the `_attr_` import strings of config."""
+    stack = [config]
+    while stack:
+        item = stack.pop()
+        if is_mapping(item):
+            name = item.get(Keys.ATTR)
+            if isinstance(name, str) and "${" not in name:
+                yield name
+            stack.extend(reversed(list(item.values())))
+        elif is_pure_iterable(item):
+            stack.extend(reversed(list(item)))
+
+
+def _import(name: str) -> Optional[str]:
+    """Import the longest module prefix of name."""
+    parts = name.split(".")
+    for idx in range(len(parts), 0, -1):
+        module_name = ".".join(parts[:idx])
+        try:
+            importlib.import_module(module_name)
+            return module_name
+        except ModuleNotFoundError as e:
+            if e.name is not None and (module_name + ".").startswith(e.name + "."):
+                continue  # Not a module, try shorter prefix
+            LOGGER.info(f"Exception while prefetching module {module_name}: {e}")
+            break
+        except Exception as e:  # pylint: disable=broad-except
+            LOGGER.info(f"Exception while prefetching module {module_name}: {e}")
+            break
+    return None
@@ -7,7 +7,9 @@ import shutil
 
 from fromconfig.core.base import fromconfig
 from fromconfig.launcher import base
+from fromconfig.utils.dotlist import to_dotlist
 from fromconfig.utils.nest import merge_dict
+from fromconfig.utils.patch import apply_patch
 from fromconfig.utils.types import is_mapping
 
 
@@ -20,8 +22,10 @@ class HParamsLauncher(base.Launcher):
     Given a config, it extracts hyper parameters ranges by instantiating
     the `hparams` entry of the config.
 
-    It then generates sets of parameters and merge their values into
-    the `hparams` entry of the config.
+    It then generates sets of parameters and sets their values in the
+    `hparams` entry of the config (mapping values are merged into the
+    existing entries). Each trial config is a patch of the original
+    config (the rest of the config is shared, not copied).
 
     Attributes
     ----------
@@ -42,7 +46,14 @@ class HParamsLauncher(base.Launcher):
                 for values in itertools.product(*[hparams[name] for name in names]):
                     overrides = dict(zip(names, values))
                     print(header(overrides))
-                    self.launcher(config=merge_dict(config, {"hparams": overrides}), command=command)
+                    patch = {}
+                    for name, value in overrides.items():
+                        # Mapping values are merged into the hparams entry
+                        current = config["hparams"].get(name)
+                        if is_mapping(current) and is_mapping(value):
+                            value = merge_dict(current, value)
+                        patch[to_dotlist(("hparams", name))] = value
+                    self.launcher(config=apply_patch(config, patch), command=command)
 
 
 def header(overrides) -> str:
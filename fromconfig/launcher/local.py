@@ -5,6 +5,7 @@ import fire
 import logging
 
 from fromconfig.core.base import fromconfig
+from fromconfig.core.lazy import lazy_fromconfig
 from fromconfig.launcher import base
 
 
@@ -12,12 +13,20 @@ LOGGER = logging.getLogger(__name__)
 
 
 class LocalLauncher(base.Launcher):
-    """Local Launcher."""
+    """Local Launcher.
 
-    def __init__(self, launcher: base.Launcher = None):
+    Attributes
+    ----------
+    lazy : bool
+        If True, only instantiate the parts of the config accessed by
+        the command (see LazyConfig).
+    """
+
+    def __init__(self, launcher: base.Launcher = None, lazy: bool = False):
         if launcher is not None:
             raise ValueError(f"LocalLauncher cannot wrap another launcher but got {launcher}")
         super().__init__(launcher=launcher)  # type: ignore
+        self.lazy: bool = lazy
 
     def __call__(self, config: Any, command: str = ""):
-        fire.Fire(fromconfig(config), command)
+        fire.Fire(lazy_fromconfig(config) if self.lazy else fromconfig(config), command)
@@ -91,6 +91,13 @@ def _fn_with_lazy_instantiations_constructor(
     return _fn_with_lazy_instantiations
 
 
+# Import strings used in parsed configs
+_FROM_IMPORT_STRING = to_import_string(from_import_string)
+_PARTIAL = to_import_string(functools.partial)
+_LAZY_ARG = to_import_string(_LazyArg)
+_FN_WITH_LAZY_INSTANTIATIONS_CONSTRUCTOR = to_import_string(_fn_with_lazy_instantiations_constructor)
+
+
 class EvaluateParser(base.Parser):
     """Evaluate parser.
 
@@ -164,14 +171,14 @@ class EvaluateParser(base.Parser):
                     if args or kwargs:
                         msg = f"Found {args} {kwargs} in item {item}, expected only {Keys.ATTR} (evaluate = {evaluate})"
                         raise ValueError(msg)
-                    return {Keys.ATTR.value: to_import_string(from_import_string), Keys.ARGS.value: [name]}
+                    return {Keys.ATTR.value: _FROM_IMPORT_STRING, Keys.ARGS.value: [name]}
 
                 # If LAZY, wrap into a _LazyArg
                 if evaluate == EvaluateMode.LAZY:
-                    fn = {Keys.ATTR.value: to_import_string(from_import_string), "name": name}
+                    fn = {Keys.ATTR.value: _FROM_IMPORT_STRING, "name": name}
                     key = item.get(self.MEMOIZATION_KEY)
                     output = {
-                        Keys.ATTR.value: to_import_string(_LazyArg),
+                        Keys.ATTR.value: _LAZY_ARG,
                         Keys.ARGS.value: [fn, key, *args],
                         **kwargs,
                     }
@@ -183,11 +190,7 @@ class EvaluateParser(base.Parser):
                     def is_lazy(arg):
                         # Argument will be parsed before the function itself and hence lazy arguments would have been
                         # wrapped into a _LazyArg
-                        return bool(
-                            is_mapping(arg)
-                            and Keys.ATTR.value in arg
-                            and arg[Keys.ATTR.value] == to_import_string(_LazyArg)
-                        )
+                        return bool(is_mapping(arg) and Keys.ATTR.value in arg and arg[Keys.ATTR.value] == _LAZY_ARG)
 
                     lazy_args_mask = [is_lazy(arg) for arg in args]
                     lazy_kwargs_map = {key: is_lazy(value) for key, value in kwargs.items()}
@@ -195,16 +198,16 @@ class EvaluateParser(base.Parser):
                     has_lazy_args_or_kwargs = any(lazy_args_mask) or any(lazy_kwargs_map.values())
 
                     if not has_lazy_args_or_kwargs:
-                        fn = {Keys.ATTR.value: to_import_string(from_import_string), "name": name}
+                        fn = {Keys.ATTR.value: _FROM_IMPORT_STRING, "name": name}
                     else:
                         fn = {
-                            Keys.ATTR.value: to_import_string(_fn_with_lazy_instantiations_constructor),
-                            "fn": {Keys.ATTR.value: to_import_string(from_import_string), "name": name},
+                            Keys.ATTR.value: _FN_WITH_LAZY_INSTANTIATIONS_CONSTRUCTOR,
+                            "fn": {Keys.ATTR.value: _FROM_IMPORT_STRING, "name": name},
                             "lazy_args_mask": lazy_args_mask,
                             "lazy_kwargs_map": lazy_kwargs_map,
                         }
                     return {
-                        Keys.ATTR.value: to_import_string(functools.partial),
+                        Keys.ATTR.value: _PARTIAL,
                         Keys.ARGS.value: [fn, *args],
                         **kwargs,
                     }
@@ -215,4 +218,4 @@ class EvaluateParser(base.Parser):
 
             return item
 
-        return depth_map(_map_fn, config)
+        return depth_map(_map_fn, config, preserve_identity=True)
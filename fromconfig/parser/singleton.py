@@ -3,6 +3,7 @@
 from collections import UserDict
 from functools import partial
 from typing import Any, Callable
+import threading
 
 from fromconfig.core import Keys
 from fromconfig.parser import base
@@ -21,14 +22,26 @@ class _Singletons(UserDict):
     >>> d2 = singleton("d1", constructor)  # constructor optional
     >>> id(d1) == id(d2)
     True
+
+    It is thread-safe: if two threads request the same singleton, the
+    constructor is only called once.
     """
 
+    def __init__(self, *args, **kwargs):
+        self._lock = threading.Lock()
+        self._locks = {}  # type: ignore
+        super().__init__(*args, **kwargs)
+
     def __call__(self, key, constructor: Callable[[], Any] = None):
         """Get or create singleton."""
         if key not in self:
-            if constructor is None:
-                raise ValueError(f"Singleton {key} not found in {self}. Please specify constructor.")
-            self[key] = constructor()
+            with self._lock:
+                lock = self._locks.setdefault(key, threading.RLock())
+            with lock:
+                if key not in self:
+                    if constructor is None:
+                        raise ValueError(f"Singleton {key} not found in {self}. Please specify constructor.")
+                    self[key] = constructor()
         return self[key]
 
     def __setitem__(self, key, value):
@@ -39,6 +52,11 @@ class _Singletons(UserDict):
 
 singleton = _Singletons()
 
+# Import strings used in parsed configs
+_FROM_IMPORT_STRING = to_import_string(from_import_string)
+_PARTIAL = to_import_string(partial)
+_SINGLETON = to_import_string(singleton)
+
 
 class SingletonParser(base.Parser):
     """Singleton parser.
@@ -76,9 +94,9 @@ class SingletonParser(base.Parser):
                 name = item[Keys.ATTR]
                 args = item.get(Keys.ARGS, [])
                 kwargs = {key: value for key, value in item.items() if key not in (self.KEY, Keys.ATTR, Keys.ARGS)}
-                attr = {Keys.ATTR.value: to_import_string(from_import_string), "name": name}
-                constructor = {Keys.ATTR.value: to_import_string(partial), Keys.ARGS.value: [attr, *args], **kwargs}
-                return {Keys.ATTR.value: to_import_string(singleton), "key": key, "constructor": constructor}
+                attr = {Keys.ATTR.value: _FROM_IMPORT_STRING, "name": name}
+                constructor = {Keys.ATTR.value: _PARTIAL, Keys.ARGS.value: [attr, *args], **kwargs}
+                return {Keys.ATTR.value: _SINGLETON, "key": key, "constructor": constructor}
             return item
 
-        return depth_map(_map_fn, config)
+        return depth_map(_map_fn, config, preserve_identity=True)
@@ -1,7 +1,11 @@
 # pylint: disable=unused-import,missing-docstring
 
 from fromconfig.utils.types import is_mapping, is_pure_iterable
-from fromconfig.utils.libimport import from_import_string, to_import_string, try_import
+from fromconfig.utils.libimport import clear_import_cache, from_import_string, to_import_string, try_import
 from fromconfig.utils.strenum import StrEnum
-from fromconfig.utils.nest import flatten, expand, merge_dict, depth_map
+from fromconfig.utils.dotlist import from_dotlist, to_dotlist
+from fromconfig.utils.nest import flatten, iter_flatten, expand, merge_dict, merge_many, depth_map
+from fromconfig.utils.index import ConfigIndex
+from fromconfig.utils.fingerprint import fingerprint
+from fromconfig.utils.patch import DELETED, diff, apply_patch
 import fromconfig.utils.testing
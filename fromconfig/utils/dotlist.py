@@ -0,0 +1,130 @@
+"""Dot-list utilities."""
+
+import functools
+from typing import Iterable, List, Tuple, Union
+
+
+# Maximum number of parsed dot-lists kept in cache
+MAXSIZE = 4096
+
+_SPECIAL = frozenset(".[]\"'\\")
+
+
+@functools.lru_cache(maxsize=MAXSIZE)
+def from_dotlist(dotlist: str) -> Tuple[Union[str, int], ...]:
+    """Convert dot-list to tuple of keys.
+
+    A dot-list is a path in a nested config, like `x.y[0]`. Keys are
+    separated by `.` and list indices are written `[idx]`. Keys with
+    special characters can be quoted (`"x.y".z`) or escaped with a
+    backslash.
+
+    Results are cached, so parsing the same dot-list more than once is
+    a dictionary lookup.
+
+    Examples
+    --------
+    >>> import fromconfig
+    >>> fromconfig.utils.from_dotlist("x.y[0]")
+    ('x', 'y', 0)
+    >>> fromconfig.utils.from_dotlist('"x.y".z')
+    ('x.y', 'z')
+
+    Parameters
+    ----------
+    dotlist : str
+        Dot-List
+
+    Raises
+    ------
+    ValueError
+        If the dot-list is malformed.
+    """
+    keys: List[Union[str, int]] = []
+    pos, end = 0, len(dotlist)
+    while True:
+        # Key (possibly empty) followed by optional list indices
+        key, pos = _parse_key(dotlist, pos)
+        keys.append(key)
+        while pos < end and dotlist[pos] == "[":
+            close = dotlist.find("]", pos)
+            if close < 0:
+                raise ValueError(f"Unterminated index in dot-list {dotlist}")
+            keys.append(int(dotlist[pos + 1 : close]))
+            pos = close + 1
+        if pos == end:
+            return tuple(keys)
+        if dotlist[pos] != ".":
+            raise ValueError(f"Unexpected character {dotlist[pos]} at position {pos} in dot-list {dotlist}")
+        pos += 1
+
+
+def to_dotlist(keys: Iterable[Union[str, int]]) -> str:
+    """Convert keys to dot-list.
+
+    Examples
+    --------
+    >>> import fromconfig
+    >>> fromconfig.utils.to_dotlist(["x", "y", 0])
+    'x.y[0]'
+    >>> fromconfig.utils.to_dotlist(["x.y", "z"])
+    '"x.y".z'
+
+    Parameters
+    ----------
+    keys : Iterable[Union[str, int]]
+        List of keys.
+    """
+    dotlist = ""
+    for idx, key in enumerate(keys):
+        if isinstance(key, str):
+            dotlist = f"{dotlist}.{quote(key)}" if idx else quote(key)
+        elif isinstance(key, int):
+            dotlist = f"{dotlist}[{key}]"
+        else:
+            raise TypeError(f"Unsupported key type {type(key)}")
+    return dotlist
+
+
+@functools.lru_cache(maxsize=MAXSIZE)
+def quote(key: str) -> str:
+    """Quote key if it contains special characters.
+
+    Parameters
+    ----------
+    key : str
+        A key of a mapping.
+    """
+    if _SPECIAL.isdisjoint(key):
+        return key
+    escaped = key.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _parse_key(dotlist: str, pos: int) -> Tuple[str, int]:
+    """Parse key starting at pos, return key and end position."""
+    chars: List[str] = []
+    end = len(dotlist)
+    while pos < end:
+        char = dotlist[pos]
+        if char in ".[":
+            break
+        if char == "\\":
+            if pos + 1 == end:
+                raise ValueError(f"Trailing escape character in dot-list {dotlist}")
+            chars.append(dotlist[pos + 1])
+            pos += 2
+        elif char in "\"'":
+            pos += 1
+            while pos < end and dotlist[pos] != char:
+                if dotlist[pos] == "\\" and pos + 1 < end:
+                    pos += 1
+                chars.append(dotlist[pos])
+                pos += 1
+            if pos == end:
+                raise ValueError(f"Unterminated quote in dot-list {dotlist}")
+            pos += 1
+        else:
+            chars.append(char)
+            pos += 1
+    return "".join(chars), pos
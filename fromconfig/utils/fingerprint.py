@@ -0,0 +1,91 @@
+"""Structural fingerprints of configs."""
+
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+
+from fromconfig.utils.types import is_mapping, is_pure_iterable
+
+
+def fingerprint(config: Any, memo: Optional[Dict[int, Tuple[Any, bytes]]] = None) -> str:
+    """Compute a stable content hash of a config.
+
+    Hashes are computed bottom-up (Merkle-style): the hash of a mapping
+    only depends on its keys and the hashes of its values (regardless
+    of the order of the keys), the hash of a list on the hashes of its
+    items and their order. Leaves are hashed from their type and repr,
+    which is stable across processes for the usual config values
+    (strings, numbers, booleans and None).
+
+    The hash of each mapping and iterable is stored in memo, keyed by
+    object id. Re-using the same memo after a structure-sharing update
+    (like merge_dict) only hashes the subtrees that are new. Configs
+    are assumed not to be mutated in place while a memo is in use.
+
+    Example
+    -------
+    >>> import fromconfig
+    >>> config = {"model": {"dim": 10}, "data": {"path": "/data"}}
+    >>> memo = {}
+    >>> fp = fromconfig.utils.fingerprint(config, memo)
+    >>> fp == fromconfig.utils.fingerprint({"data": {"path": "/data"}, "model": {"dim": 10}})
+    True
+    >>> merged = fromconfig.utils.merge_dict(config, {"model": {"dim": 20}})
+    >>> fromconfig.utils.fingerprint(merged, memo) == fp
+    False
+
+    Parameters
+    ----------
+    config : Any
+        Typically a dictionary (possibly nested)
+    memo : Dict[int, Tuple[Any, bytes]], optional
+        Cache of the hashes of mappings and iterables, updated in place.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest.
+    """
+    memo = {} if memo is None else memo
+
+    # Iterative post-order traversal, same structure as depth_map
+    result: List[bytes] = []
+    stack: List[Tuple[Any, Any, List[bytes]]] = [(None, iter([config]), result)]
+    while stack:
+        _, children, digests = stack[-1]
+        for child in children:
+            if is_mapping(child) or is_pure_iterable(child):
+                cached = memo.get(id(child))
+                if cached is not None and cached[0] is child:
+                    digests.append(cached[1])
+                    continue
+                stack.append((child, iter(child.values() if is_mapping(child) else child), []))
+                break
+            digests.append(_leaf(child))
+        else:
+            node, _, digests = stack.pop()
+            if not stack:
+                break
+            if is_mapping(node):
+                pairs = sorted(_hash(b"P", _leaf(key), digest) for key, digest in zip(node.keys(), digests))
+                digest = _hash(b"M", *pairs)
+            elif isinstance(node, (set, frozenset)):
+                digest = _hash(b"S", *sorted(digests))
+            else:
+                digest = _hash(b"L", *digests)
+            memo[id(node)] = (node, digest)
+            stack[-1][2].append(digest)
+
+    return result[0].hex()
+
+
+def _leaf(item: Any) -> bytes:
+    """Hash of a leaf, from its type and repr."""
+    return _hash(b"V", f"{type(item).__module__}.{type(item).__qualname__}:{item!r}".encode())
+
+
+def _hash(tag: bytes, *parts: bytes) -> bytes:
+    """Hash of tag and parts."""
+    hasher = hashlib.blake2b(tag, digest_size=16)
+    for part in parts:
+        hasher.update(part)
+    return hasher.digest()
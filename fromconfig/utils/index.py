@@ -0,0 +1,156 @@
+"""Config index."""
+
+from typing import Any, Dict, Iterator, List, Tuple, Union
+
+from fromconfig.utils.dotlist import from_dotlist, to_dotlist
+from fromconfig.utils.types import is_mapping, is_pure_iterable
+
+
+Path = Tuple[Union[str, int], ...]
+
+_MISSING = object()
+
+
+class ConfigIndex:
+    """Index of the nodes of a nested config by path.
+
+    The config is walked once, then every node is accessible in
+    constant time by path (dot-list or tuple of keys). Updates made
+    through the index are applied to the config in place and only the
+    affected subtree is re-indexed. Updates made directly on the config
+    are not tracked.
+
+    Example
+    -------
+    >>> import fromconfig
+    >>> config = {"model": {"dims": [32, 64]}, "hparams": {}}
+    >>> index = fromconfig.utils.ConfigIndex(config)
+    >>> index["model.dims[1]"]
+    64
+    >>> index.set("hparams.learning_rate", 0.1)
+    >>> config["hparams"]
+    {'learning_rate': 0.1}
+    >>> index.delete("model.dims[0]")
+    >>> index["model.dims[0]"]
+    64
+
+    Attributes
+    ----------
+    config : Any
+        The indexed config.
+    """
+
+    def __init__(self, config: Any):
+        self.config = config
+        self._nodes: Dict[Path, Any] = {}
+        self._parents: Dict[Path, Any] = {}
+        self._add((), config, None)
+
+    def __getitem__(self, path: Union[str, Path]) -> Any:
+        return self._nodes[_to_path(path)]
+
+    def __contains__(self, path: Union[str, Path]) -> bool:
+        return _to_path(path) in self._nodes
+
+    def __iter__(self) -> Iterator[str]:
+        return (to_dotlist(path) for path in self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def get(self, path: Union[str, Path], default: Any = None) -> Any:
+        """Get node at path, default if path is not in the index."""
+        return self._nodes.get(_to_path(path), default)
+
+    def parent(self, path: Union[str, Path]) -> Any:
+        """Get parent of node at path (None for the root)."""
+        return self._parents[_to_path(path)]
+
+    def set(self, path: Union[str, Path], value: Any):
+        """Set node at path, creating missing parent mappings.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Dot-list or tuple of keys.
+        value : Any
+            New value of the node at path.
+        """
+        path = _to_path(path)
+        if not path:
+            self.config = value
+            self._nodes.clear()
+            self._parents.clear()
+            self._add((), value, None)
+            return
+
+        # Create missing parent mappings
+        parent_path, key = path[:-1], path[-1]
+        parent = self._nodes.get(parent_path, _MISSING)
+        if parent is _MISSING:
+            self.set(parent_path, {})
+            parent = self._nodes[parent_path]
+
+        # Replace existing node and its children
+        if path in self._nodes:
+            self._remove(path, self._nodes[path])
+        parent[key] = value
+        self._add(path, value, parent)
+
+    def delete(self, path: Union[str, Path]):
+        """Delete node at path.
+
+        Deleting an item of a list shifts the following items, which
+        are re-indexed.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Dot-list or tuple of keys.
+        """
+        path = _to_path(path)
+        if not path:
+            raise KeyError("Cannot delete the root of the config")
+        node, parent = self._nodes[path], self._parents[path]
+        if is_mapping(parent):
+            self._remove(path, node)
+            del parent[path[-1]]
+        else:
+            # Re-index the whole list since indices are shifted
+            parent_path = path[:-1]
+            for idx, item in enumerate(parent):
+                self._remove((*parent_path, idx), item)
+            del parent[path[-1]]
+            for idx, item in enumerate(parent):
+                self._add((*parent_path, idx), item, parent)
+
+    def _add(self, path: Path, node: Any, parent: Any):
+        """Index node at path and its children."""
+        stack: List[Tuple[Path, Any, Any]] = [(path, node, parent)]
+        while stack:
+            path, node, parent = stack.pop()
+            self._nodes[path] = node
+            self._parents[path] = parent
+            if is_mapping(node):
+                stack.extend(((*path, key), value, node) for key, value in node.items())
+            elif is_pure_iterable(node):
+                stack.extend(((*path, idx), value, node) for idx, value in enumerate(node))
+
+    def _remove(self, path: Path, node: Any):
+        """Remove node at path and its children from the index."""
+        stack: List[Tuple[Path, Any]] = [(path, node)]
+        while stack:
+            path, node = stack.pop()
+            self._nodes.pop(path, None)
+            self._parents.pop(path, None)
+            if is_mapping(node):
+                stack.extend(((*path, key), value) for key, value in node.items())
+            elif is_pure_iterable(node):
+                stack.extend(((*path, idx), value) for idx, value in enumerate(node))
+
+
+def _to_path(path: Union[str, Path]) -> Path:
+    """Convert dot-list or keys to a tuple of keys."""
+    if isinstance(path, str):
+        return from_dotlist(path) if path else ()
+    return tuple(path)
@@ -1,14 +1,29 @@
 """Import utilities."""
 
-from typing import Any
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional, Tuple
 import builtins
 import importlib
 import inspect
 import logging
+import sys
+from types import FrameType
 
 
 LOGGER = logging.getLogger(__name__)
 
+MAXSIZE = 4096
+
+
+class _NotFound:
+    """Marker of an import string not resolvable from modules."""
+
+
+_NOT_FOUND = _NotFound()
+
+# Reverse index of module members (id -> name), by module name
+_MEMBERS: Dict[str, Dict[int, str]] = {}
+
 
 def try_import(name, package=None):
     """Try import package name in package."""
@@ -40,13 +55,32 @@ def to_import_string(attr: Any) -> str:
             return f"{module.__name__}.{attr.__qualname__}"
 
     # Look for the instance's name in the user-defined module
-    for name, member in inspect.getmembers(module):
-        if id(member) == id(attr):
-            return f"{module.__name__}.{name}"
+    name = _member_name(module, attr)
+    if name is not None:
+        return f"{module.__name__}.{name}"
 
     raise ValueError(f"Unable to resolve import string of {attr}")  # pragma: no cover
 
 
+def _member_name(module: Any, attr: Any) -> Optional[str]:
+    """Name of attr in module, using a cached reverse index.
+
+    The index is rebuilt if attr is not found or if the cached name
+    does not refer to attr anymore. Like inspect.getmembers, the first
+    name in alphabetical order is used if attr has multiple names.
+    """
+    members = vars(module)
+    name = _MEMBERS.get(module.__name__, {}).get(id(attr))
+    if name is not None and members.get(name) is attr:
+        return name
+    index: Dict[int, str] = {}
+    for key in sorted(members):
+        index.setdefault(id(members[key]), key)
+    _MEMBERS[module.__name__] = index
+    name = index.get(id(attr))
+    return name if name is not None and members[name] is attr else None
+
+
 def from_import_string(name: str) -> Any:
     """Import module, class, method or attribute from string.
 
@@ -66,6 +100,75 @@ def from_import_string(name: str) -> Any:
     if not parts:
         raise ImportError(f"No parts found (name='{name}', parts={parts})")
 
+    # Resolve from modules and builtins (module resolution is cached,
+    # attributes are looked up on every call to follow re-bindings)
+    owner, offset = _from_modules(name)
+    if owner is not _NOT_FOUND:
+        try:
+            attr = owner
+            for part in parts[offset:]:
+                attr = getattr(attr, part)
+            return attr
+        except Exception as e:  # pylint: disable=broad-except
+            LOGGER.info(f"Exception while getting attribute from module {owner}: {e}")
+
+    # Get attribute from call stack modules
+    for f_globals in _iter_globals():
+        try:
+            attr = f_globals[parts[offset]]
+            for part in parts[offset + 1 :]:
+                attr = getattr(attr, part)
+            return attr
+        except Exception as e:  # pylint: disable=broad-except
+            LOGGER.info(f"Exception while getting attribute from module {f_globals.get('__name__')}: {e}")
+
+    # Look for name in call stack globals
+    for f_globals in _iter_globals():
+        if name in f_globals:
+            return f_globals[name]
+
+    raise ValueError(f"Unable to resolve attribute from import string '{name}'")
+
+
+def _iter_globals() -> Iterator[Dict[str, Any]]:
+    """Iterate over the globals of the frames of the call stack.
+
+    Walks the frames from the current one to the outermost one with
+    the f_back links, which is much cheaper than inspect.stack (that
+    reads the source context of every frame).
+    """
+    frame: Optional[FrameType] = sys._getframe(1)  # pylint: disable=protected-access
+    while frame is not None:
+        yield frame.f_globals
+        frame = frame.f_back
+
+
+def clear_import_cache():
+    """Clear the cache of from_import_string.
+
+    The module (or builtins) from which an import string is resolved
+    is cached, as well as failures to resolve it from modules. The
+    attribute itself is looked up on every call, so re-bound module
+    attributes (for example with mock.patch) are picked up. Clear the
+    cache if modules become importable after a first call (for example
+    after changing sys.path).
+    """
+    _from_modules.cache_clear()
+
+
+@lru_cache(maxsize=MAXSIZE)
+def _from_modules(name: str) -> Tuple[Any, int]:
+    """Resolve the owner of an import string from modules and builtins.
+
+    Returns
+    -------
+    Tuple[Any, int]
+        The module or builtins from which the remaining parts resolve
+        (_NOT_FOUND if not resolved), and the number of parts of name
+        that are modules.
+    """
+    parts = [part for part in name.split(".") if part]
+
     # Import modules
     module, offset = None, 0
     for idx in range(1, len(parts)):
@@ -77,20 +180,14 @@ def from_import_string(name: str) -> Any:
             LOGGER.info(f"Exception while loading module from {module_name}: {e}")
             break
 
-    # Get attribute from provided module, builtins or call stack modules
-    for mod in [module, builtins] + [inspect.getmodule(fi.frame) for fi in inspect.stack()]:
+    # Get attribute from provided module or builtins
+    for mod in [module, builtins]:
         try:
             attr = mod
             for part in parts[offset:]:
                 attr = getattr(attr, part)
-            return attr
+            return mod, offset
         except Exception as e:  # pylint: disable=broad-except
             LOGGER.info(f"Exception while getting attribute from module {mod}: {e}")
 
-    # Look for name in call stack globals
-    for fi in inspect.stack():
-        for key, value in fi.frame.f_globals.items():
-            if key == name:
-                return value
-
-    raise ValueError(f"Unable to resolve attribute from import string '{name}'")
+    return _NOT_FOUND, offset
@@ -1,17 +1,29 @@
 """Nest Utilities."""
 
 import logging
-from typing import Callable, Dict, Any, Mapping, List, Tuple, Iterable, Union
+from typing import Callable, Dict, Any, Mapping, List, Tuple, Iterable, Iterator
 
+from fromconfig.utils.dotlist import from_dotlist, quote
 from fromconfig.utils.types import is_mapping, is_pure_iterable
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Common leaf types, checked first to skip the slower ABC checks
+_SCALARS = frozenset([str, int, float, bool, type(None)])
 
-def depth_map(map_fn: Callable[[Any], Any], item: Any) -> Any:
+
+def depth_map(map_fn: Callable[[Any], Any], item: Any, preserve_identity: bool = False) -> Any:
     """Depth-first map implementation on dictionary, tuple and list.
 
+    By default, every mapping and iterable is rebuilt as a new dict or
+    list before being given to map_fn. With preserve_identity, a dict
+    or list whose children were all returned untouched by map_fn is
+    given to map_fn as is, so unchanged subtrees are shared with the
+    input and only the paths that actually changed are reallocated.
+    Other mappings and iterables (tuples, OrderedDict, etc.) are still
+    converted to dict and list.
+
     Examples
     --------
     >>> import fromconfig
@@ -21,32 +33,82 @@ def depth_map(map_fn: Callable[[Any], Any], item: Any) -> Any:
     >>> mapped["x"]
     2
 
+    With preserve_identity, unchanged subtrees are not copied
+
+    >>> config = {"x": 1, "y": {"z": "a"}}
+    >>> mapped = fromconfig.utils.depth_map(add_one, config, preserve_identity=True)
+    >>> mapped["y"] is config["y"]
+    True
+
     Parameters
     ----------
     map_fn : Callable[[Any], Any]
         Map Function to apply to item and its children
     item : Any
         Any python object
+    preserve_identity : bool, optional
+        If True, give unchanged nodes to map_fn instead of copies. In
+        that case map_fn must not mutate its input.
 
     Returns
     -------
     Any
         The result of applying map_fn to item and its children.
     """
-    # If mapping, try to create new mapping with mapped kwargs
-    if is_mapping(item):
-        return map_fn({key: depth_map(map_fn, value) for key, value in item.items()})
-
-    # If iterable, try to create new iterable with mapped args
-    if is_pure_iterable(item):
-        return map_fn([depth_map(map_fn, it) for it in item])
+    # Iterative post-order traversal (no recursion limit on depth).
+    # Each frame is [node, children iterator, mapped children, changed]
+    # where changed is True if any mapped child is not the original.
+    # The bottom frame has no node and collects the mapped item.
+    result: List[Any] = []
+    stack: List[List[Any]] = [[None, iter([item]), result, False]]
+    while stack:
+        frame = stack[-1]
+        mapped = frame[2]
+        for child in frame[1]:
+            if type(child) in _SCALARS:
+                value = map_fn(child)
+                if value is not child:
+                    frame[3] = True
+                mapped.append(value)
+                continue
+            if is_mapping(child):
+                stack.append([child, iter(child.values()), [], False])
+                break
+            if is_pure_iterable(child):
+                stack.append([child, iter(child), [], False])
+                break
+            value = map_fn(child)
+            if value is not child:
+                frame[3] = True
+            mapped.append(value)
+        else:
+            node, _, values, changed = stack.pop()
+            if not stack:
+                break
+            # Unchanged children, reuse node (only if already normalized)
+            if preserve_identity and not changed and type(node) in (dict, list):
+                value = map_fn(node)
+            # If mapping, create new mapping with mapped values
+            elif is_mapping(node):
+                value = map_fn(dict(zip(node.keys(), values)))
+            # If iterable, create new list with mapped items
+            else:
+                value = map_fn(values)
+            parent = stack[-1]
+            if value is not node:
+                parent[3] = True
+            parent[2].append(value)
 
-    return map_fn(item)
+    return result[0]
 
 
 def merge_dict(item1: Mapping, item2: Mapping, allow_override: bool = True) -> Dict:
     """Merge item2 into item1.
 
+    The result has the keys of item1 in order, followed by the new keys
+    of item2. Subtrees that are not overridden are shared by reference
+    with item1 and item2 (they are not copied).
+
     Examples
     --------
     >>> import fromconfig
@@ -74,19 +136,18 @@ def merge_dict(item1: Mapping, item2: Mapping, allow_override: bool = True) -> D
         """Recursive implementation."""
         if is_mapping(it1):
             if not is_mapping(it2):
-                raise TypeError(f"Incompatible types, {type(it2)} and {type(it2)}")
+                raise TypeError(f"Incompatible types, {type(it1)} and {type(it2)}")
 
-            # Build merged dictionary
-            merged = {}
-            for key in set(it1) | set(it2):
-                if key in it1 and key in it2:
+            # Shallow copy of item1 (keeps its key order and shares its
+            # values), only keys of item2 need to be visited
+            merged = dict(it1)
+            for key, value in it2.items():
+                if key in merged:
                     if not allow_override:
                         raise ValueError(f"Duplicate key found {key} and allow_override = False (not allowed)")
-                    merged[key] = _merge(it1[key], it2[key])
-                if key in it1 and key not in it2:
-                    merged[key] = it1[key]
-                if key not in it1 and key in it2:
-                    merged[key] = it2[key]
+                    merged[key] = _merge(merged[key], value)
+                else:
+                    merged[key] = value
 
             return merged
 
@@ -95,6 +156,75 @@ def merge_dict(item1: Mapping, item2: Mapping, allow_override: bool = True) -> D
     return _merge(item1, item2)
 
 
+def merge_many(*items: Any, allow_override: bool = True) -> Any:
+    """Merge items successively, in one traversal.
+
+    Equivalent to `functools.reduce(merge_dict, items)` (each item
+    overrides the previous ones), but the values of a key are merged all
+    at once instead of re-copying the growing result for each item.
+
+    Examples
+    --------
+    >>> import fromconfig
+    >>> merged = fromconfig.utils.merge_many({"x": 1}, {"y": 2}, {"x": 3})
+    >>> merged["x"]
+    3
+    >>> merged["y"]
+    2
+
+    Parameters
+    ----------
+    *items : Any
+        Mappings to merge, last ones take precedence.
+    allow_override : bool, optional
+        If True, allow keys to be present in more than one item
+
+    Returns
+    -------
+    Any
+    """
+
+    def _merge(values: List[Any]):
+        """Recursive implementation."""
+        # A non-mapping value is simply replaced by the next one, only
+        # the values since the last non-mapping value need merging.
+        group: List[Any] = []
+        for value in values:
+            if group and is_mapping(group[0]):
+                if not is_mapping(value):
+                    raise TypeError(f"Incompatible types, {type(group[0])} and {type(value)}")
+                group.append(value)
+            else:
+                group = [value]
+        if len(group) == 1:
+            return group[0]
+
+        # Shallow copy of the first mapping, collect values of keys
+        # present in more than one mapping and merge them all at once
+        merged = dict(group[0])
+        overridden: Dict[Any, List[Any]] = {}
+        for mapping in group[1:]:
+            for key, value in mapping.items():
+                if key in merged:
+                    if not allow_override:
+                        raise ValueError(f"Duplicate key found {key} and allow_override = False (not allowed)")
+                    if key in overridden:
+                        overridden[key].append(value)
+                    else:
+                        overridden[key] = [merged[key], value]
+                else:
+                    merged[key] = value
+        for key, layer_values in overridden.items():
+            merged[key] = _merge(layer_values)
+
+        return merged
+
+    if not items:
+        return {}
+    merged = _merge(list(items))
+    return dict(merged) if is_mapping(merged) else merged
+
+
 def flatten(config: Any) -> List[Tuple[str, Any]]:
     """Flatten dictionary into a list of tuples key, value.
 
@@ -116,28 +246,67 @@ def flatten(config: Any) -> List[Tuple[str, Any]]:
     List[Tuple[Optional[str], Any]]
         Each tuple is a flattened key with the corresponding value.
     """
+    return list(iter_flatten(config))
 
-    def _flatten(item) -> List[Tuple[List[Union[str, int]], Any]]:
-        if is_mapping(item):
-            result = []
-            for key, values in item.items():
-                if "." in key:
-                    raise ValueError(f"Key {key} already has a `.`, unable to flatten.")
-                for subkeys, value in values:
-                    result.append(([str(key)] + subkeys, value))
-            return result
 
-        if is_pure_iterable(item):
-            result = []
-            for idx, it in enumerate(item):
-                for subkeys, value in it:
-                    result.append(([idx] + subkeys, value))
-            return result
+def iter_flatten(config: Any) -> Iterator[Tuple[str, Any]]:
+    """Lazily flatten dictionary into tuples key, value.
 
-        return [([], item)]
+    Single depth-first traversal that yields the flattened keys and
+    values without building intermediate lists, so that large configs
+    can be streamed (to a logger, a file, etc.).
 
-    flattened = depth_map(_flatten, config)
-    return [(_to_dotlist(key), value) for key, value in flattened]
+    Example
+    -------
+    >>> import fromconfig
+    >>> d = {"x": {"y": 0}, "z": [1]}
+    >>> for key, value in fromconfig.utils.iter_flatten(d):
+    ...     print(key, value)
+    x.y 0
+    z[0] 1
+
+    Parameters
+    ----------
+    config : Any
+        Typically a dictionary (possibly nested)
+
+    Yields
+    ------
+    Tuple[str, Any]
+        A flattened key with the corresponding value.
+    """
+    if not (is_mapping(config) or is_pure_iterable(config)):
+        yield "", config
+        return
+
+    stack = [_iter_children("", config)]
+    while stack:
+        for key, value in stack[-1]:
+            if is_mapping(value) or is_pure_iterable(value):
+                stack.append(_iter_children(key, value))
+                break
+            yield key, value
+        else:
+            stack.pop()
+
+
+def _iter_children(prefix: str, item: Any) -> Iterator[Tuple[str, Any]]:
+    """Iterate over the flattened keys and values of children of item.
+
+    Parameters
+    ----------
+    prefix : str
+        Flattened key of item.
+    item : Any
+        A mapping or a pure iterable.
+    """
+    if is_mapping(item):
+        for key, value in item.items():
+            key = quote(str(key))
+            yield (f"{prefix}.{key}" if prefix else key), value
+    else:
+        for idx, value in enumerate(item):
+            yield f"{prefix}[{idx}]", value
 
 
 def expand(flat: Iterable[Tuple[str, Any]]):
@@ -156,20 +325,6 @@ def expand(flat: Iterable[Tuple[str, Any]]):
         Iterable of flat keys, value
     """
 
-    def _expand(it: List[Tuple[List[Union[str, int]], Any]]) -> Dict:
-        # Recursive step
-        result = {}  # type: ignore
-        for keys, value in it:
-            if not keys:
-                if None in result:
-                    raise KeyError("More than one pure value found (not allowed)")
-                result[None] = value
-            else:
-                key = keys[0]
-                value = _expand([(keys[1:], value)])
-                result[key] = merge_dict(value, result.get(key, {}))
-        return result
-
     def _normalize(it):
         if is_mapping(it) and any(isinstance(key, int) for key in it):
             return [it[idx] for idx in range(len(it))]
@@ -179,41 +334,13 @@ def expand(flat: Iterable[Tuple[str, Any]]):
             return it[None]
         return it
 
-    return depth_map(_normalize, _expand([(_from_dotlist(dotlist), value) for dotlist, value in flat]))
-
+    # Insert each path once in a trie, pure values stored under None
+    # (if a path is given more than once, the first value is kept)
+    trie = {}  # type: Dict[Any, Any]
+    for dotlist, value in flat:
+        node = trie
+        for key in from_dotlist(dotlist):
+            node = node.setdefault(key, {})
+        node.setdefault(None, value)
 
-def _to_dotlist(keys: List[Union[str, int]]) -> str:
-    """Convert list of keys to dot-list.
-
-    Parameters
-    ----------
-    keys : List[Union[str, int]]
-        List of keys.
-    """
-    dotlist = ""
-    for key in keys:
-        if isinstance(key, str):
-            dotlist = key if not dotlist else f"{dotlist}.{key}"
-        elif isinstance(key, int):
-            dotlist = f"{dotlist}[{key}]"
-        else:
-            raise TypeError(f"Unsupported key type {type(key)}")
-    return dotlist
-
-
-def _from_dotlist(dotlist: str) -> List[Union[str, int]]:
-    """Convert dot-list to list of keys.
-
-    Parameters
-    ----------
-    dotlist : str
-        Dot-List
-    """
-    keys: List[Union[str, int]] = []
-    for item in dotlist.split("."):
-        for it in item.split("["):
-            if it.endswith("]"):
-                keys.append(int(it.rstrip("]")))
-            else:
-                keys.append(it)
-    return keys
+    return depth_map(_normalize, trie)
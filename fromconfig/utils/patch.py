@@ -0,0 +1,140 @@
+"""Config diff and patch utilities."""
+
+from typing import Any, Dict, List, Mapping, Set, Tuple
+
+from fromconfig.utils.dotlist import from_dotlist, to_dotlist
+from fromconfig.utils.types import is_mapping
+
+
+class _Deleted:
+    """Marker of a deleted key in a patch."""
+
+    def __repr__(self):
+        return "DELETED"
+
+
+DELETED = _Deleted()
+
+
+def diff(item1: Any, item2: Any) -> Dict[str, Any]:
+    """Compute the patch that transforms item1 into item2.
+
+    Mappings are compared key by key. Other values (including lists)
+    are compared as a whole. Subtrees shared by item1 and item2 (same
+    object) are skipped without being visited, so that the cost is
+    proportional to the changes when item2 was derived from item1 with
+    a structure-sharing update (merge_dict, apply_patch).
+
+    Example
+    -------
+    >>> import fromconfig
+    >>> config = {"model": {"dim": 10, "act": "relu"}, "hparams": {}}
+    >>> patch = fromconfig.utils.diff(config, {"model": {"dim": 20}, "hparams": {}})
+    >>> patch
+    {'model.dim': 20, 'model.act': DELETED}
+    >>> fromconfig.utils.apply_patch(config, patch)
+    {'model': {'dim': 20}, 'hparams': {}}
+
+    Parameters
+    ----------
+    item1 : Any
+        Reference config
+    item2 : Any
+        New config
+
+    Returns
+    -------
+    Dict[str, Any]
+        Mapping from dot-list to new value (DELETED for deleted keys).
+    """
+    if item1 is item2:
+        return {}
+    if not (is_mapping(item1) and is_mapping(item2)):
+        return {} if _equal(item1, item2) else {"": item2}
+
+    patch: Dict[str, Any] = {}
+    stack: List[Tuple[Tuple[Any, ...], Mapping, Mapping, Any]] = [((), item1, item2, iter(item2.items()))]
+    while stack:
+        path, it1, it2, children = stack[-1]
+        for key, value in children:
+            if key not in it1:
+                patch[to_dotlist((*path, key))] = value
+                continue
+            old = it1[key]
+            if is_mapping(old) and is_mapping(value) and old is not value:
+                stack.append(((*path, key), old, value, iter(value.items())))
+                break
+            if not _equal(old, value):
+                patch[to_dotlist((*path, key))] = value
+        else:
+            stack.pop()
+            for key in it1:
+                if key not in it2:
+                    patch[to_dotlist((*path, key))] = DELETED
+
+    return patch
+
+
+def apply_patch(base: Any, patch: Mapping[str, Any]) -> Any:
+    """Apply patch to base, sharing unchanged subtrees.
+
+    Only the containers on the path of a patched key are copied, other
+    subtrees are shared with base (base is not modified). Missing
+    intermediate mappings are created.
+
+    Parameters
+    ----------
+    base : Any
+        Reference config
+    patch : Mapping[str, Any]
+        Mapping from dot-list to new value (DELETED to delete the key),
+        typically the output of diff. The empty dot-list is the root.
+
+    Returns
+    -------
+    Any
+    """
+    result = base
+    owned: Set[int] = set()  # Containers copied during this call
+
+    def _own(item):
+        copy = dict(item) if is_mapping(item) else list(item)
+        owned.add(id(copy))
+        return copy
+
+    for dotlist, value in patch.items():
+        keys = from_dotlist(dotlist) if dotlist else ()
+        if not keys:
+            result = value
+            continue
+        if id(result) not in owned:
+            result = _own(result)
+        node = result
+        for key in keys[:-1]:
+            if is_mapping(node) and key not in node:
+                child: Dict[Any, Any] = {}
+                owned.add(id(child))
+            elif id(node[key]) not in owned:
+                child = _own(node[key])
+            else:
+                child = node[key]
+            node[key] = child
+            node = child
+        if value is DELETED:
+            del node[keys[-1]]
+        else:
+            node[keys[-1]] = value
+
+    return result
+
+
+def _equal(item1: Any, item2: Any) -> bool:
+    """Strict equality of two values (same type and equal)."""
+    if item1 is item2:
+        return True
+    if type(item1) is not type(item2):
+        return False
+    try:
+        return bool(item1 == item2)
+    except Exception:  # pylint: disable=broad-except
+        return False
@@ -1,12 +1,14 @@
 """Tests for cli.main."""
 
 import fromconfig
-from fromconfig.cli.main import parse_args
+from fromconfig.cli.main import launch, main, parse_args
 import sys
 from unittest.mock import patch
 
 import subprocess
 
+import pytest
+
 
 def capture(command):
     """Utility to execute and capture the result of a command."""
@@ -75,3 +77,50 @@ def test_cli_main(tmpdir):
     assert exitcode == 0, (out, err)
     assert out == b"hello world\n"
     assert err == b""
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        pytest.param(None, None, id="unset"),
+        pytest.param("", None, id="empty"),
+        pytest.param("2", 2, id="valid"),
+        pytest.param("two", None, id="not-an-integer"),
+        pytest.param("0", None, id="zero"),
+        pytest.param("-1", None, id="negative"),
+    ],
+)
+def test_cli_main_max_workers(monkeypatch, value, expected):
+    """Test that invalid FROMCONFIG_MAX_WORKERS fall back to the default."""
+    calls = []
+    monkeypatch.setattr(fromconfig.cli.main, "launch", lambda *args, **kwargs: calls.append(kwargs))
+    monkeypatch.setattr(sys, "argv", ["fromconfig", "config.yaml"])
+    if value is None:
+        monkeypatch.delenv("FROMCONFIG_MAX_WORKERS", raising=False)
+    else:
+        monkeypatch.setenv("FROMCONFIG_MAX_WORKERS", value)
+    main()
+    assert calls[0]["max_workers"] == expected
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 2])
+def test_cli_launch_merge_order(tmpdir, capsys, max_workers):
+    """Test that cli.launch merges configs from left to right."""
+    paths = []
+    for idx in range(5):
+        paths.append(str(tmpdir.join(f"config{idx}.yaml")))
+        fromconfig.dump({"value": idx, f"value{idx}": idx}, paths[-1])
+    launch(paths, {}, "value", max_workers=max_workers)
+    assert capsys.readouterr().out == "4\n"
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_cli_launch_prefetch(tmpdir, capsys, monkeypatch, prefetch):
+    """Test that cli.launch only prefetches imports if requested."""
+    calls = []
+    monkeypatch.setattr(fromconfig, "prefetch_imports", calls.append)
+    path = str(tmpdir.join("config.yaml"))
+    fromconfig.dump({"value": 1}, path)
+    launch([path], {}, "value", prefetch=prefetch)
+    assert capsys.readouterr().out == "1\n"
+    assert calls == ([{"value": 1}] if prefetch else [])
@@ -0,0 +1,13 @@
+"""Shared fixtures."""
+
+import pytest
+
+from tests.unit.tracking import CALLS
+
+
+@pytest.fixture
+def calls():
+    """Calls of tests.unit.tracking.track during the test."""
+    CALLS.clear()
+    yield CALLS
+    CALLS.clear()
@@ -1,6 +1,11 @@
 """Tests for core.base."""
 
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import asyncio
 import inspect
+import threading
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
@@ -61,3 +66,148 @@ def test_default_custom_fromconfig(config, expected):
 def test_core_fromconfig(config, expected):
     """Test core.fromconfig."""
     assert fromconfig.fromconfig(config) == expected
+
+
+def wait_for_sibling(barrier, value):
+    """Only returns if called concurrently with a sibling."""
+    barrier.wait()
+    return value
+
+
+def fail(message):
+    """Raise ValueError with message."""
+    raise ValueError(message)
+
+
+def test_core_fromconfig_executor():
+    """Test that siblings are instantiated concurrently."""
+    barrier = threading.Barrier(2, timeout=10)
+    config = {
+        "x": {"_attr_": "tests.unit.core.test_core_base.wait_for_sibling", "_args_": [barrier, 1]},
+        "y": [{"_attr_": "tests.unit.core.test_core_base.wait_for_sibling", "_args_": [barrier, 2]}],
+        "z": "z",
+    }
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert fromconfig.fromconfig(config, executor=executor) == {"x": 1, "y": [2], "z": "z"}
+
+
+def test_core_fromconfig_executor_caller_names():
+    """Test that names of the caller's module are resolved with an executor."""
+    barrier = threading.Barrier(2, timeout=10)
+    config = {
+        "x": {"_attr_": "wait_for_sibling", "_args_": [barrier, 1]},
+        "y": [{"_attr_": "wait_for_sibling", "_args_": [barrier, 2]}],
+    }
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert fromconfig.fromconfig(config, executor=executor) == {"x": 1, "y": [2]}
+
+
+def test_core_fromconfig_executor_fromconfig_subtree(monkeypatch):
+    """Test that the subtrees of FromConfig nodes are not resolved with an executor."""
+    names = []
+    from_import_string = fromconfig.utils.from_import_string
+
+    def _from_import_string(name):
+        names.append(name)
+        return from_import_string(name)
+
+    monkeypatch.setattr(fromconfig.core.base, "from_import_string", _from_import_string)
+    payload = {"_attr_": "tests.unit.core.missing.Model", "dim": 1}
+    config = {"x": {"_attr_": "fromconfig.Config", "_config_": payload}, "y": {"_attr_": "str", "_args_": [1]}}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert fromconfig.fromconfig(config, executor=executor) == {"x": payload, "y": "1"}
+    assert "fromconfig.Config" in names
+    assert "tests.unit.core.missing.Model" not in names
+
+
+def test_core_fromconfig_executor_errors():
+    """Test that the error of the first failing argument is raised."""
+    config = {
+        "_attr_": "dict",
+        "x": {"_attr_": "tests.unit.core.test_core_base.fail", "message": "x"},
+        "y": {"_attr_": "tests.unit.core.test_core_base.fail", "message": "y"},
+    }
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for _ in range(10):
+            with pytest.raises(ValueError, match="x"):
+                fromconfig.fromconfig(config, executor=executor)
+
+
+def test_core_fromconfig_executor_singleton():
+    """Test that singletons are shared between threads."""
+    config = {
+        "x": [{"_attr_": "dict", "_singleton_": "test_core_fromconfig_executor_singleton"} for _ in range(10)],
+        "y": {"_attr_": "dict", "_singleton_": "test_core_fromconfig_executor_singleton"},
+    }
+    parsed = fromconfig.parser.SingletonParser()(config)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            instance = fromconfig.fromconfig(parsed, executor=executor)
+        assert all(item is instance["y"] for item in instance["x"])
+    finally:
+        fromconfig.parser.singleton.clear()
+
+
+async def async_wait_for_sibling(started, value):
+    """Only returns if a sibling is started concurrently."""
+    started.count += 1
+    for _ in range(1000):
+        if started.count > 1:
+            return value
+        await asyncio.sleep(0.001)
+    raise RuntimeError("Sibling was not started concurrently")
+
+
+class AsyncCustom(fromconfig.FromConfig):
+    """Custom FromConfig class with async fromconfig."""
+
+    def __init__(self, x):
+        self.x = x
+
+    @classmethod
+    async def afromconfig(cls, config: Any):
+        await asyncio.sleep(0)
+        return cls(config["x"])
+
+
+def test_core_afromconfig():
+    """Test core.afromconfig."""
+
+    async def _main():
+        started = SimpleNamespace(count=0)
+        config = {
+            "x": {"_attr_": "tests.unit.core.test_core_base.async_wait_for_sibling", "_args_": [started, 1]},
+            "y": [{"_attr_": "tests.unit.core.test_core_base.async_wait_for_sibling", "_args_": [started, 2]}],
+            "z": {"_attr_": "tests.unit.core.test_core_base.AsyncCustom", "x": 3},
+            "w": {"_attr_": "tests.unit.core.test_core_base.Custom", "x": 4},
+            "v": {"_attr_": "str", "_args_": [5]},
+        }
+        return await fromconfig.afromconfig(config)
+
+    got = asyncio.get_event_loop().run_until_complete(_main())
+    assert got["x"] == 1
+    assert got["y"] == [2]
+    assert isinstance(got["z"], AsyncCustom) and got["z"].x == 3
+    assert got["w"] == Custom(4)
+    assert got["v"] == "5"
+
+
+def test_core_fromconfig_memo():
+    """Test that shared nodes are instantiated once with a memo."""
+    shared = {"_attr_": "tests.unit.core.test_core_base.Custom", "x": [1]}
+    config = {"x": shared, "y": [shared, {"z": shared}], "w": {"_attr_": "list"}, "v": {"_attr_": "list"}}
+    instance = fromconfig.fromconfig(config, memo={})
+    assert instance["x"] is instance["y"][0] is instance["y"][1]["z"]
+    assert instance["w"] is not instance["v"], "equal but distinct nodes should not be shared"
+    instance = fromconfig.fromconfig(config)
+    assert instance["x"] is not instance["y"][0], "no memoization by default"
+
+
+def test_core_fromconfig_memo_yaml_anchors(tmpdir):
+    """Test that nodes shared with YAML anchors are instantiated once."""
+    path = Path(tmpdir, "config.yaml")
+    path.write_text("shared: &shared\n  _attr_: collections.OrderedDict\nx: *shared\ny:\n  - *shared\nz: {a: 1}\n")
+    config = fromconfig.load(path)
+    assert config["x"] is config["shared"] is config["y"][0]
+    instance = fromconfig.fromconfig(config, memo={})
+    assert instance["x"] is instance["shared"] is instance["y"][0]
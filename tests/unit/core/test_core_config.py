@@ -1,8 +1,10 @@
 """Tests for core.config."""
 
+import io
 import json
 import yaml
 from pathlib import Path
+import os
 
 import pytest
 
@@ -91,9 +93,12 @@ def test_core_config_load_dump(path, serializer, tmpdir):
 
 
 @pytest.mark.parametrize("config, expected", [pytest.param("foo: bar", {"foo": "bar"})])
-def test_core_config_include_loader_on_string(config, expected):
+@pytest.mark.parametrize(
+    "loader", [fromconfig.core.config.IncludeLoader, fromconfig.core.config.CIncludeLoader], ids=["python", "c"]
+)
+def test_core_config_include_loader_on_string(config, expected, loader):
     """Test IncludeLoader."""
-    assert expected == yaml.load(config, fromconfig.core.config.IncludeLoader)
+    assert expected == yaml.load(config, loader)
 
 
 @pytest.mark.parametrize(
@@ -108,7 +113,9 @@ def test_core_config_include_loader_on_string(config, expected):
             id="simple-merge",
         ),
         pytest.param(
-            {"config.yaml": "foo: 1\n<<: !include bar.yaml", "bar.yaml": "2"}, None, id="simple-merge-invalid"
+            {"config.yaml": "foo: 1\n<<: !include bar.yaml", "bar.yaml": "2"},
+            yaml.YAMLError,
+            id="simple-merge-invalid",
         ),
         pytest.param(
             {"config.yaml": "foo: 1\nbar: !include bar/bar.yaml", "bar/bar.yaml": "2"},
@@ -146,7 +153,11 @@ def test_core_config_load_include_merge(files, expected, tmpdir):
         Path(tmpdir, p).parent.mkdir(parents=True, exist_ok=True)
         with Path(tmpdir, p).open("w") as file:
             file.write(content)
-    assert fromconfig.load(Path(tmpdir, "config.yaml")) == expected
+    if expected is yaml.YAMLError:
+        with pytest.raises(yaml.YAMLError):
+            fromconfig.load(Path(tmpdir, "config.yaml"))
+    else:
+        assert fromconfig.load(Path(tmpdir, "config.yaml")) == expected
 
 
 @pytest.mark.parametrize(
@@ -170,3 +181,84 @@ def test_core_config_load_include_merge(files, expected, tmpdir):
 def test_core_config_fromconfig(config, expected):
     """Test Config.fromconfig."""
     assert fromconfig.Config.fromconfig(config) == expected
+
+
+def test_core_config_load_cache(tmpdir, monkeypatch):
+    """Test persistent cache of load."""
+    cache_dir = Path(tmpdir, "cache")
+    path, include_path = Path(tmpdir, "config.yaml"), Path(tmpdir, "bar.yaml")
+    path.write_text("foo: 1\n<<: !include bar.yaml")
+    include_path.write_text("bar: 2")
+    assert fromconfig.load(path, cache_dir=cache_dir) == {"foo": 1, "bar": 2}
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # Warm load does not parse YAML
+    with monkeypatch.context() as m:
+        m.setattr(fromconfig.core.config, "yaml_load", None)
+        assert fromconfig.load(path, cache_dir=cache_dir) == {"foo": 1, "bar": 2}
+
+    # Changing an include invalidates the entry
+    include_path.write_text("bar: 3")
+    os.utime(include_path, ns=(0, 0))
+    assert fromconfig.load(path, cache_dir=cache_dir) == {"foo": 1, "bar": 3}
+
+    # Cache directory from environment variable
+    monkeypatch.setenv("FROMCONFIG_CACHE_DIR", str(cache_dir))
+    with monkeypatch.context() as m:
+        m.setattr(fromconfig.core.config, "yaml_load", None)
+        assert fromconfig.load(path) == {"foo": 1, "bar": 3}
+
+
+def test_core_config_load_include_once(tmpdir, monkeypatch):
+    """Test that a file included multiple times is loaded once."""
+    Path(tmpdir, "config.yaml").write_text("foo: !include defaults.yaml\nbar: !include defaults.yaml")
+    Path(tmpdir, "defaults.yaml").write_text("x: [1, 2]")
+    load_file = fromconfig.core.config._load_file  # pylint: disable=protected-access
+    calls = []
+    monkeypatch.setattr(
+        fromconfig.core.config, "_load_file", lambda path, context: calls.append(path) or load_file(path, context)
+    )
+    config = fromconfig.load(Path(tmpdir, "config.yaml"))
+    assert config == {"foo": {"x": [1, 2]}, "bar": {"x": [1, 2]}}
+    assert config["foo"] is not config["bar"]
+    assert len(calls) == 2
+
+
+def test_core_config_load_include_cycle(tmpdir):
+    """Test that include cycles are detected."""
+    Path(tmpdir, "config.yaml").write_text("foo: !include bar.yaml")
+    Path(tmpdir, "bar.yaml").write_text("<<: !include config.yaml")
+    with pytest.raises(fromconfig.IncludeCycleError) as excinfo:
+        fromconfig.load(Path(tmpdir, "config.yaml"))
+    assert "config.yaml -> " in str(excinfo.value) and "bar.yaml -> " in str(excinfo.value)
+
+
+@pytest.mark.parametrize("size", [-1, 1, 7, 1024])
+def test_core_config_include_expander(size):
+    """Test that _IncludeExpander rewrites merge includes lines."""
+    stream = io.StringIO("foo: 1\n<<: !include bar.yaml\nbar:\n  <<: !include baz.yaml\n<<:   !include baz.yaml")
+    expander = fromconfig.core.config._IncludeExpander(stream)  # pylint: disable=protected-access
+    chunks = []
+    for chunk in iter(lambda: expander.read(size), ""):
+        assert size < 0 or len(chunk) <= size
+        chunks.append(chunk)
+    expected = "foo: 1\n1!include<<: !include bar.yaml\nbar:\n  <<: !include baz.yaml\n4!include<<:   !include baz.yaml"
+    assert "".join(chunks) == expected
+
+
+def test_core_config_load_fallback_large_file(tmpdir):
+    """Test that the yaml.safe_load fallback reads the file from the start."""
+    path = Path(tmpdir, "config.yaml")
+    lines = ["foo: [1\n"] + [f"k{idx}: {idx}\n" for idx in range(30000)]
+    path.write_text("".join(lines))
+    assert path.stat().st_size > 65536  # Larger than one read chunk
+    with pytest.raises(yaml.YAMLError):
+        fromconfig.load(path)
+
+
+def test_core_config_load_fallback_int_keys(tmpdir):
+    """Test that the yaml.safe_load fallback reads the whole file."""
+    path = Path(tmpdir, "config.yaml")
+    path.write_text("".join(f"{idx}: {idx}\n" for idx in range(30000)))
+    assert path.stat().st_size > 65536  # Larger than one read chunk
+    assert fromconfig.load(path) == {idx: idx for idx in range(30000)}
@@ -0,0 +1,52 @@
+"""Tests for core.instantiator."""
+
+import fromconfig
+from tests.unit.tracking import tracked as node
+
+
+def test_core_instantiator(calls):
+    """Test that Instantiator only rebuilds changed subtrees."""
+    instantiator = fromconfig.Instantiator()
+    config = {"model": node("model", layer=node("layer", dim=1), other=node("other")), "data": node("data")}
+    first = instantiator(config)
+    assert first == fromconfig.fromconfig(config)
+    calls.clear()
+
+    # Change a leaf of layer: layer and model are rebuilt
+    config = {"model": node("model", layer=node("layer", dim=2), other=node("other")), "data": node("data")}
+    second = instantiator(config)
+    assert sorted(calls) == ["layer", "model"]
+    assert second["data"] is first["data"]
+    assert second["model"]["other"] is first["model"]["other"]
+    assert second["model"]["layer"] == {"name": "layer", "dim": 2}
+    calls.clear()
+
+    # Same config: nothing is rebuilt
+    assert instantiator(config) is second
+    assert not calls
+
+    # After clear, everything is rebuilt
+    instantiator.clear()
+    instantiator(config)
+    assert sorted(calls) == ["data", "layer", "model", "other"]
+
+
+def test_core_instantiator_fromconfig_subclass():
+    """Test that Instantiator works with FromConfig subclasses."""
+    instantiator = fromconfig.Instantiator()
+    config = {"x": {"_attr_": "fromconfig.Config", "_config_": {"y": 1}}, "z": [1]}
+    first = instantiator(config)
+    assert first == {"x": {"y": 1}, "z": [1]}
+    second = instantiator({"x": {"_attr_": "fromconfig.Config", "_config_": {"y": 1}}, "z": [2]})
+    assert second["x"] is first["x"]
+    assert second["z"] == [2]
+
+
+def test_core_instantiator_types():
+    """Test that Instantiator does not reuse instances of another type."""
+    instantiator = fromconfig.Instantiator()
+    assert instantiator({"x": [1, 2]}) == {"x": [1, 2]}
+    assert instantiator({"x": (1, 2)}) == {"x": (1, 2)}
+    assert isinstance(instantiator({"x": (1, 2)})["x"], tuple)
+    assert instantiator({"a": [1], "b": (1,)}) == {"a": [1], "b": (1,)}
+    assert instantiator({"b": [1], "a": (1,)}) == {"a": (1,), "b": [1]}
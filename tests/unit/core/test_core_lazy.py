@@ -0,0 +1,61 @@
+"""Tests for core.lazy."""
+
+import fire
+import pytest
+
+import fromconfig
+from tests.unit.tracking import tracked
+
+
+def test_core_lazy_config(calls):
+    """Test LazyConfig only instantiates accessed values once."""
+    config = {
+        "x": {"y": tracked("y"), "z": [1]},
+        "w": tracked("w"),
+    }
+    lazy = fromconfig.LazyConfig(config)
+    assert calls == []
+    assert isinstance(lazy["x"], fromconfig.LazyConfig)
+    assert lazy["x"]["y"] == {"name": "y"}
+    assert lazy.x.y == {"name": "y"}
+    assert lazy.get("x").get("z") == [1]
+    assert calls == ["y"]
+    assert dict(lazy.items())["w"] == {"name": "w"}
+    assert calls == ["y", "w"]
+    with pytest.raises(AttributeError):
+        lazy.missing  # pylint: disable=pointless-statement,no-member
+
+
+@pytest.mark.parametrize(
+    "config, expected",
+    [
+        pytest.param({"_attr_": "str", "_args_": [1]}, "1", id="attr"),
+        pytest.param([{"_attr_": "str", "_args_": [1]}], ["1"], id="list"),
+        pytest.param(1, 1, id="leaf"),
+    ],
+)
+def test_core_lazy_fromconfig(config, expected):
+    """Test lazy_fromconfig on non-plain mappings."""
+    assert fromconfig.lazy_fromconfig(config) == expected
+
+
+def test_core_lazy_config_methods(calls):
+    """Test that LazyConfig methods are consistent with access by key."""
+    config = {"x": tracked("x"), "y": tracked("y"), "z": 1}
+    lazy = fromconfig.LazyConfig(config)
+    assert repr(lazy) == f"LazyConfig({config!r})"
+    assert list(lazy.keys()) == ["x", "y", "z"] and len(lazy) == 3 and "x" in lazy
+    assert not calls
+    assert lazy.pop("x") == {"name": "x"}
+    assert lazy.pop("x", None) is None
+    assert lazy == {"y": {"name": "y"}, "z": 1}
+    assert not lazy != {"y": {"name": "y"}, "z": 1}  # pylint: disable=unneeded-not
+    assert lazy.copy() == {"y": {"name": "y"}, "z": 1}
+    assert calls == ["x", "y"]
+
+
+def test_core_lazy_config_fire_help(capsys):
+    """Test that Fire help shows the config keys, not the LazyConfig docstring."""
+    fire.Fire(fromconfig.LazyConfig({"x": {"_attr_": "collections.OrderedDict"}, "y": len}), "")
+    out = capsys.readouterr().out
+    assert "x" in out and "first access" not in out
@@ -0,0 +1,79 @@
+"""Tests for core.plan."""
+
+import pytest
+
+import fromconfig
+
+
+class Point:
+    """Point."""
+
+    def __init__(self, x, y=0):
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other):
+        return type(self) == type(other) and (self.x, self.y) == (
+            other.x,
+            other.y,
+        )  # pylint: disable=unidiomatic-typecheck
+
+
+class Custom(fromconfig.FromConfig):
+    """Custom FromConfig class."""
+
+    def __init__(self, x):
+        self.x = x
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self.x == other.x  # pylint: disable=unidiomatic-typecheck
+
+    @classmethod
+    def fromconfig(cls, config):
+        return cls(config["x"])
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.param(1, id="leaf"),
+        pytest.param({"x": 1, "_args_": [2]}, id="mapping-with-args"),
+        pytest.param({"x": [1, (2, 3)]}, id="nested"),
+        pytest.param({"_attr_": "tests.unit.core.test_core_plan.Point", "_args_": [1], "y": 2}, id="call"),
+        pytest.param(
+            {"p": {"_attr_": "tests.unit.core.test_core_plan.Point", "x": {"_attr_": "str"}}}, id="nested-call"
+        ),
+        pytest.param({"_attr_": "tests.unit.core.test_core_plan.Custom", "x": {"y": 1}}, id="fromconfig"),
+        pytest.param({"_attr_": "fromconfig.Config", "_config_": {"_attr_": "str"}}, id="config"),
+    ],
+)
+def test_core_plan(config):
+    """Test that executing a plan is equivalent to fromconfig."""
+    plan = fromconfig.compile(config)
+    assert plan() == fromconfig.fromconfig(config)
+    assert plan() == fromconfig.fromconfig(config), "plans can be executed more than once"
+
+
+def test_core_plan_substitutions():
+    """Test plan execution with substitutions."""
+    config = {
+        "point": {"_attr_": "tests.unit.core.test_core_plan.Point", "_args_": [1], "y": 2},
+        "custom": {"_attr_": "tests.unit.core.test_core_plan.Custom", "x": {"y": 1}},
+    }
+    plan = fromconfig.compile(config)
+    got = plan({"point._args_[0]": 10, "point.y": 20, "custom.x.y": 2})
+    assert got == {"point": Point(10, 20), "custom": Custom({"y": 2})}
+    assert plan() == {"point": Point(1, 2), "custom": Custom({"y": 1})}, "substitutions should not persist"
+    with pytest.raises(KeyError):
+        plan({"point": 1})
+    with pytest.raises(KeyError):
+        plan({"custom.x.zzz": 5})
+
+
+def test_core_plan_fromconfig_config_not_shared():
+    """Test that FromConfig steps get a new sub-config on each call."""
+    plan = fromconfig.compile({"_attr_": "tests.unit.core.test_core_plan.Custom", "x": {"y": 1}})
+    first = plan()
+    first.x["y"] = 2
+    assert plan() == Custom({"y": 1})
+    assert plan().x is not plan().x
@@ -0,0 +1,22 @@
+"""Tests for core.prefetch."""
+
+import pytest
+
+import fromconfig
+
+
+@pytest.mark.parametrize(
+    "config, expected",
+    [
+        pytest.param({"_attr_": "dict"}, [], id="builtin"),
+        pytest.param({"x": [{"_attr_": "collections.OrderedDict"}]}, ["collections"], id="nested"),
+        pytest.param({"_attr_": "os.path.join", "x": {"_attr_": "os.path.split"}}, ["os.path"], id="duplicates"),
+        pytest.param({"_attr_": "fromconfig.core.base.FromConfig.fromconfig"}, ["fromconfig.core.base"], id="method"),
+        pytest.param({"_attr_": "${module}.Class"}, [], id="interpolation"),
+        pytest.param({"_attr_": "package_that_does_not_exist.Class"}, [None], id="missing"),
+    ],
+)
+def test_core_prefetch_imports(config, expected):
+    """Test core.prefetch_imports."""
+    futures = fromconfig.prefetch_imports(config)
+    assert [future.result() for future in futures] == expected
@@ -14,6 +14,12 @@ import fromconfig
             [({"hparams": {"dim": 10}}, "command"), ({"hparams": {"dim": 100}}, "command")],
             id="dict",
         ),
+        pytest.param(
+            {"hparams": {"model": {"_attr_": "list", "_args_": [[{"dim": 10}]]}}},
+            "command",
+            [({"hparams": {"model": {"_attr_": "list", "_args_": [[{"dim": 10}]], "dim": 10}}}, "command")],
+            id="dict-values",
+        ),
         pytest.param([], "command", [([], "command")], id="list"),
         pytest.param(None, "command", [(None, "command")], id="none"),
     ],
@@ -3,6 +3,7 @@
 import pytest
 
 import fromconfig
+from tests.unit.tracking import tracked
 
 
 def test_launcher_local_init():
@@ -35,3 +36,14 @@ def test_launcher_local_types(config, command):
     """Test that LocalLauncher accepts different types."""
     launcher = fromconfig.launcher.LocalLauncher()
     launcher(config, command)
+
+
+@pytest.mark.parametrize(
+    "lazy, expected", [pytest.param(True, ["run"], id="lazy"), pytest.param(False, ["other", "run"], id="eager")]
+)
+def test_launcher_local_lazy(lazy, expected, calls):
+    """Test that the lazy LocalLauncher only instantiates the command."""
+    config = {"run": tracked("run"), "other": tracked("other")}
+    launcher = fromconfig.launcher.DefaultLauncher.fromconfig({"run": {"_attr_": "local", "lazy": lazy}})
+    launcher(config, "run")
+    assert sorted(calls) == expected
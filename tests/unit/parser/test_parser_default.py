@@ -1,5 +1,7 @@
 """Tests for parser.__init__."""
 
+from collections import OrderedDict
+
 import pytest
 
 import fromconfig
@@ -16,3 +18,21 @@ def test_parser_default_parser(config, expected):
         assert fromconfig.fromconfig(parsed)() == expected()
     else:
         assert fromconfig.fromconfig(parsed) == expected
+
+
+@pytest.mark.parametrize(
+    "parser",
+    [
+        pytest.param(fromconfig.parser.DefaultParser(), id="default"),
+        pytest.param(fromconfig.parser.EvaluateParser(), id="evaluate"),
+        pytest.param(fromconfig.parser.SingletonParser(), id="singleton"),
+    ],
+)
+def test_parser_output_types(parser):
+    """Test that parsers normalize tuples and mappings to list and dict."""
+    config = {"x": (1, 2), "y": OrderedDict(z=(3,)), "w": [{"v": 1}]}
+    parsed = parser(config)
+    assert parsed == {"x": [1, 2], "y": {"z": [3]}, "w": [{"v": 1}]}
+    assert type(parsed["x"]) is list  # pylint: disable=unidiomatic-typecheck
+    assert type(parsed["y"]) is dict  # pylint: disable=unidiomatic-typecheck
+    assert type(parsed["y"]["z"]) is list  # pylint: disable=unidiomatic-typecheck
@@ -0,0 +1,14 @@
+"""Track instantiations in tests."""
+
+CALLS = []
+
+
+def track(name, **kwargs):
+    """Record call and return name and kwargs."""
+    CALLS.append(name)
+    return {"name": name, **kwargs}
+
+
+def tracked(name, **kwargs):
+    """Config of a tracked node."""
+    return {"_attr_": "tests.unit.tracking.track", "name": name, **kwargs}
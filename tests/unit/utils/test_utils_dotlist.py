@@ -0,0 +1,53 @@
+"""Tests for utils.dotlist."""
+
+import pytest
+
+import fromconfig
+
+
+@pytest.mark.parametrize(
+    "dotlist, keys",
+    [
+        pytest.param("x", ("x",), id="simple"),
+        pytest.param("x.y", ("x", "y"), id="nested"),
+        pytest.param("x[0][1].y", ("x", 0, 1, "y"), id="index"),
+        pytest.param("[0]", ("", 0), id="index-only"),
+        pytest.param('"x.y".z', ("x.y", "z"), id="quoted"),
+        pytest.param("'x[0]'", ("x[0]",), id="single-quoted"),
+        pytest.param(r'"x\"y"', ('x"y',), id="quoted-escape"),
+        pytest.param(r"x\.y.z", ("x.y", "z"), id="escape"),
+    ],
+)
+def test_utils_from_dotlist(dotlist, keys):
+    """Test utils.from_dotlist."""
+    assert fromconfig.utils.from_dotlist(dotlist) == keys
+
+
+@pytest.mark.parametrize(
+    "dotlist",
+    [
+        pytest.param('"x.y', id="unterminated-quote"),
+        pytest.param("x[0", id="unterminated-index"),
+        pytest.param("x[a]", id="invalid-index"),
+        pytest.param("x[0]y", id="unexpected"),
+        pytest.param("x\\", id="trailing-escape"),
+    ],
+)
+def test_utils_from_dotlist_errors(dotlist):
+    """Test utils.from_dotlist errors."""
+    with pytest.raises(ValueError):
+        fromconfig.utils.from_dotlist(dotlist)
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        pytest.param(("x", "y", 0), id="simple"),
+        pytest.param(("x.y", "z"), id="dot"),
+        pytest.param(('x"y', "z\\", "[0]"), id="special"),
+        pytest.param(("x", ""), id="empty"),
+    ],
+)
+def test_utils_to_dotlist(keys):
+    """Test that utils.to_dotlist and utils.from_dotlist roundtrip."""
+    assert fromconfig.utils.from_dotlist(fromconfig.utils.to_dotlist(keys)) == keys
@@ -0,0 +1,35 @@
+"""Tests for utils.fingerprint."""
+
+import pytest
+
+import fromconfig
+
+
+@pytest.mark.parametrize(
+    "item1, item2, equal",
+    [
+        pytest.param({"x": 1, "y": 2}, {"y": 2, "x": 1}, True, id="mapping-order"),
+        pytest.param([1, 2], [2, 1], False, id="list-order"),
+        pytest.param({"x": [1, {"y": 2}]}, {"x": (1, {"y": 2})}, True, id="tuple-list"),
+        pytest.param({"x": 1}, {"x": "1"}, False, id="leaf-type"),
+        pytest.param({"x": {"y": 1}}, {"x": {"y": 2}}, False, id="nested"),
+        pytest.param({"x": 1, "y": 2}, {"x": 2, "y": 1}, False, id="swapped-values"),
+        pytest.param({"x": []}, {"x": {}}, False, id="empty"),
+    ],
+)
+def test_utils_fingerprint(item1, item2, equal):
+    """Test utils.fingerprint."""
+    assert (fromconfig.utils.fingerprint(item1) == fromconfig.utils.fingerprint(item2)) == equal
+
+
+def test_utils_fingerprint_memo():
+    """Test that the memo is reused for shared subtrees."""
+    config = {"x": {"y": 1}, "z": {"w": [1, 2]}}
+    memo = {}
+    fromconfig.utils.fingerprint(config, memo)
+    assert id(config["z"]) in memo
+    merged = fromconfig.utils.merge_dict(config, {"x": {"y": 2}})
+    memo[id(config["z"])] = (config["z"], b"cached")
+    fp = fromconfig.utils.fingerprint(merged, memo)
+    assert fp != fromconfig.utils.fingerprint(merged), "shared subtree should not be re-hashed"
+    assert id(merged["x"]) in memo
@@ -0,0 +1,54 @@
+"""Tests for utils.index."""
+
+import pytest
+
+import fromconfig
+
+
+def test_utils_config_index_get():
+    """Test ConfigIndex lookups."""
+    config = {"x": {"y": [1, {"z": 2}]}, "a.b": 3}
+    index = fromconfig.utils.ConfigIndex(config)
+    assert index[""] is config
+    assert index["x.y[1].z"] == 2
+    assert index[("x", "y", 0)] == 1
+    assert index['"a.b"'] == 3
+    assert index.parent("x.y[1]") is config["x"]["y"]
+    assert index.get("x.missing") is None
+    assert "x.y" in index
+    assert "x.y[2]" not in index
+    assert len(index) == 7
+    assert set(index) == {"", "x", "x.y", "x.y[0]", "x.y[1]", "x.y[1].z", '"a.b"'}
+    with pytest.raises(KeyError):
+        index["x.missing"]  # pylint: disable=pointless-statement
+
+
+def test_utils_config_index_set():
+    """Test ConfigIndex.set."""
+    config = {"x": {"y": {"z": 1}}}
+    index = fromconfig.utils.ConfigIndex(config)
+    index.set("x.y", {"w": [2]})
+    assert config == {"x": {"y": {"w": [2]}}}
+    assert "x.y.z" not in index
+    assert index["x.y.w[0]"] == 2
+    index.set("a.b", 1)
+    assert config["a"] == {"b": 1}
+    assert index["a"] is config["a"]
+    index.set("", {"new": 1})
+    assert index.config == {"new": 1}
+    assert list(index) == ["", "new"]
+
+
+def test_utils_config_index_delete():
+    """Test ConfigIndex.delete."""
+    config = {"x": [{"y": 1}, {"y": 2}], "z": {"w": 1}}
+    index = fromconfig.utils.ConfigIndex(config)
+    index.delete("z")
+    assert "z" not in config
+    assert "z.w" not in index
+    index.delete("x[0]")
+    assert config["x"] == [{"y": 2}]
+    assert index["x[0].y"] == 2
+    assert "x[1]" not in index
+    with pytest.raises(KeyError):
+        index.delete("")
@@ -75,3 +75,48 @@ def test_utils_to_import_string(attr, name):
             fromconfig.utils.to_import_string(attr)
     else:
         assert fromconfig.utils.to_import_string(attr) == name
+
+
+def test_utils_from_import_string_rebinding(monkeypatch):
+    """Test that from_import_string picks up re-bound attributes."""
+    assert fromconfig.utils.from_import_string("tests.unit.utils.test_utils_libimport.Class.VARIABLE") == "VARIABLE"
+    monkeypatch.setattr(Class, "VARIABLE", "OTHER")
+    assert fromconfig.utils.from_import_string("tests.unit.utils.test_utils_libimport.Class.VARIABLE") == "OTHER"
+
+    def mocked():
+        """Mocked function."""
+
+    assert fromconfig.utils.from_import_string("tests.unit.utils.test_utils_libimport.function") is function
+    monkeypatch.setattr(f"{__name__}.function", mocked)
+    assert fromconfig.utils.from_import_string("tests.unit.utils.test_utils_libimport.function") is mocked
+
+
+def test_utils_from_import_string_local_not_cached():
+    """Test that names resolved from the call stack are still found."""
+    for _ in range(2):
+        assert fromconfig.utils.from_import_string("function") is function
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            fromconfig.utils.from_import_string("name_that_does_not_exist")
+
+
+def test_utils_from_import_string_globals():
+    """Test that from_import_string finds exact names in call stack globals."""
+    globals()["dotted.name"] = function
+    try:
+        assert fromconfig.utils.from_import_string("dotted.name") is function
+    finally:
+        del globals()["dotted.name"]
+
+
+INSTANCE = Class()
+
+
+def test_utils_to_import_string_instance(monkeypatch):
+    """Test that to_import_string follows changes of module members."""
+    assert fromconfig.utils.to_import_string(INSTANCE) == "tests.unit.utils.test_utils_libimport.INSTANCE"
+    old, new = INSTANCE, Class()
+    monkeypatch.setattr(f"{__name__}.INSTANCE", new)
+    assert fromconfig.utils.to_import_string(new) == "tests.unit.utils.test_utils_libimport.INSTANCE"
+    with pytest.raises(ValueError):
+        fromconfig.utils.to_import_string(old)
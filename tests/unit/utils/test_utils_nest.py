@@ -1,6 +1,8 @@
 """Test for utils.nest."""
 
+from collections import OrderedDict
 import copy
+import functools
 import numbers
 from functools import partial
 import pytest
@@ -14,6 +16,7 @@ import fromconfig
         pytest.param({"x": 1}, [("x", 1)]),
         pytest.param({"x": {"y": 1}}, [("x.y", 1)]),
         pytest.param({"x": [1]}, [("x[0]", 1)]),
+        pytest.param({"a.b": {"c": "d"}}, [('"a.b".c', "d")], id="key-has-dot"),
     ],
 )
 def test_utils_flatten_expand(config, expected):
@@ -22,10 +25,18 @@ def test_utils_flatten_expand(config, expected):
     assert fromconfig.utils.expand(expected) == config
 
 
-@pytest.mark.parametrize("config", [pytest.param({"a.b": {"c": "d"}}, id="key-has-dot")])
-def test_utils_flatten_impossible(config):
-    with pytest.raises(ValueError):
-        fromconfig.utils.flatten(config)
+@pytest.mark.parametrize(
+    "config, expected",
+    [
+        pytest.param(1, [("", 1)], id="scalar"),
+        pytest.param({"x": {}, "y": [[1], {"z": 2}]}, [("y[0][0]", 1), ("y[1].z", 2)], id="nested"),
+    ],
+)
+def test_utils_iter_flatten(config, expected):
+    """Test utils.iter_flatten."""
+    flattened = fromconfig.utils.iter_flatten(config)
+    assert not isinstance(flattened, list)
+    assert list(flattened) == expected
 
 
 @pytest.mark.parametrize(
@@ -74,3 +85,107 @@ def test_utils_depth_map(map_fn, item, expected):
     got = fromconfig.utils.depth_map(map_fn, item)
     assert got == expected, f"{got} != {expected}"
     assert original == item, "depth_map should not mutate"
+
+
+def test_utils_depth_map_deep():
+    """Test utils.depth_map on configs deeper than the recursion limit."""
+    item = 1
+    for _ in range(10000):
+        item = {"x": [item]}
+    got = fromconfig.utils.depth_map(partial(inc, value=1), item)
+    for _ in range(10000):
+        got = got["x"][0]
+    assert got == 2
+
+
+@pytest.mark.parametrize(
+    "item, expected, shared",
+    [
+        pytest.param({"x": 1, "y": {"z": "a"}}, {"x": 2, "y": {"z": "a"}}, ["y"], id="dict"),
+        pytest.param({"x": [1], "y": ["a"]}, {"x": [2], "y": ["a"]}, ["y"], id="list"),
+        pytest.param({"x": {"y": "a"}, "z": ["b"]}, {"x": {"y": "a"}, "z": ["b"]}, ["x", "z"], id="unchanged"),
+        pytest.param({"x": ("b",), "y": OrderedDict(z="a")}, {"x": ["b"], "y": {"z": "a"}}, [], id="normalized"),
+    ],
+)
+def test_utils_depth_map_preserve_identity(item, expected, shared):
+    """Test utils.depth_map with preserve_identity."""
+    original = copy.deepcopy(item)
+    got = fromconfig.utils.depth_map(partial(inc, value=1), item, preserve_identity=True)
+    assert got == expected, f"{got} != {expected}"
+    assert original == item, "depth_map should not mutate"
+    assert all(type(got[key]) is type(expected[key]) for key in expected)  # pylint: disable=unidiomatic-typecheck
+    for key in shared:
+        assert got[key] is item[key]
+
+
+@pytest.mark.parametrize(
+    "flat, expected",
+    [
+        pytest.param([("x.y", 1), ("x.z", 2), ("a", 3)], {"x": {"y": 1, "z": 2}, "a": 3}, id="order"),
+        pytest.param([("x[1]", 2), ("x[0].y", 1)], {"x": [{"y": 1}, 2]}, id="list"),
+        pytest.param([("x", 1), ("x", 2)], {"x": 1}, id="duplicate"),
+    ],
+)
+def test_utils_expand(flat, expected):
+    """Test utils.expand."""
+    got = fromconfig.utils.expand(flat)
+    assert got == expected
+    assert list(got) == list(expected)
+
+
+@pytest.mark.parametrize(
+    "flat",
+    [
+        pytest.param([("x", 1), ("x.y", 2)], id="pure-value-and-key"),
+        pytest.param([("x[1]", 1)], id="missing-index"),
+        pytest.param([("x[0]", 1), ("x.y", 1)], id="index-and-key"),
+    ],
+)
+def test_utils_expand_errors(flat):
+    """Test utils.expand errors."""
+    with pytest.raises(KeyError):
+        fromconfig.utils.expand(flat)
+
+
+def test_utils_merge_dict_order_and_sharing():
+    """Test that utils.merge_dict preserves order and shares subtrees."""
+    item1 = {"b": {"x": 1}, "a": {"y": 2}, "c": [1]}
+    item2 = {"d": {"z": 3}, "a": {"y": 4}}
+    merged = fromconfig.utils.merge_dict(item1, item2)
+    assert list(merged) == ["b", "a", "c", "d"]
+    assert merged["b"] is item1["b"]
+    assert merged["c"] is item1["c"]
+    assert merged["d"] is item2["d"]
+    assert merged["a"] == {"y": 4}
+    assert item1["a"] == {"y": 2}, "merge_dict should not mutate"
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        pytest.param([{"x": 1}, {"y": 2}, {"x": 3}], id="simple"),
+        pytest.param([{"x": {"y": 1}}, {"x": {"z": 2}}, {"x": {"y": 3}}], id="nested"),
+        pytest.param([{"x": 1}, {"x": {"y": 2}}, {"x": {"z": 3}}], id="override-with-mapping"),
+        pytest.param([{"x": [1]}, {"x": [2]}, {"y": 1}], id="list"),
+        pytest.param([{"x": 1}], id="single"),
+    ],
+)
+def test_utils_merge_many(items):
+    """Test utils.merge_many is equivalent to successive merge_dict."""
+    expected = functools.reduce(fromconfig.utils.merge_dict, items)
+    got = fromconfig.utils.merge_many(*items)
+    assert got == expected
+    assert list(got) == list(expected)
+
+
+@pytest.mark.parametrize(
+    "items, allow_override, error",
+    [
+        pytest.param([{"x": {"y": 1}}, {"y": 2}, {"x": 1}], True, TypeError, id="incompatible"),
+        pytest.param([{"x": 1}, {"y": 2}, {"x": 2}], False, ValueError, id="override"),
+    ],
+)
+def test_utils_merge_many_errors(items, allow_override, error):
+    """Test utils.merge_many errors."""
+    with pytest.raises(error):
+        fromconfig.utils.merge_many(*items, allow_override=allow_override)
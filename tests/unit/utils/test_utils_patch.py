@@ -0,0 +1,36 @@
+"""Tests for utils.patch."""
+
+import pytest
+
+import fromconfig
+
+
+@pytest.mark.parametrize(
+    "item1, item2, expected",
+    [
+        pytest.param({"x": 1}, {"x": 1}, {}, id="same"),
+        pytest.param({"x": 1}, {"x": 2}, {"x": 2}, id="change"),
+        pytest.param({"x": 1}, {"x": 1.0}, {"x": 1.0}, id="type-change"),
+        pytest.param({"x": {"y": 1, "z": 2}}, {"x": {"y": 1}}, {"x.z": fromconfig.utils.DELETED}, id="delete"),
+        pytest.param({"x": {"y": 1}}, {"x": {"y": 1}, "a.b": [1]}, {'"a.b"': [1]}, id="add"),
+        pytest.param({"x": [1, 2]}, {"x": [1, 3]}, {"x": [1, 3]}, id="list"),
+        pytest.param({"x": {"y": 1}}, {"x": 1}, {"x": 1}, id="mapping-to-value"),
+        pytest.param(1, 2, {"": 2}, id="root"),
+    ],
+)
+def test_utils_diff_apply_patch(item1, item2, expected):
+    """Test utils.diff and utils.apply_patch."""
+    patch = fromconfig.utils.diff(item1, item2)
+    assert patch == expected
+    assert fromconfig.utils.apply_patch(item1, patch) == item2
+
+
+def test_utils_apply_patch_sharing():
+    """Test that utils.apply_patch shares unchanged subtrees."""
+    base = {"model": {"dim": 10}, "data": {"path": "/data"}, "hparams": {"dim": [10, 20]}}
+    patched = fromconfig.utils.apply_patch(base, {"hparams.dim": 20, "hparams.new.x": 1})
+    assert patched == {"model": {"dim": 10}, "data": {"path": "/data"}, "hparams": {"dim": 20, "new": {"x": 1}}}
+    assert base["hparams"] == {"dim": [10, 20]}, "apply_patch should not mutate"
+    assert patched["model"] is base["model"]
+    assert patched["data"] is base["data"]
+    assert fromconfig.utils.diff(base, patched) == {"hparams.dim": 20, "hparams.new": {"x": 1}}